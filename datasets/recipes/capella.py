@@ -8,8 +8,13 @@ SAR data accessed through Hum's internal STAC FastAPI catalog.
 Collection: capella (stac-fastapi)
 Primary polarization: HH (>98% of holdings)
 Resolution: 1.0m
+
+Importing this module only builds the configuration objects below; run it
+as a script to print the summary.
 """
 
+import sys
+
 from hum_ai.data_engine.collections import CollectionName
 from hum_ai.data_engine.ingredients import (
     COLLECTION_BAND_MAP,
@@ -19,27 +24,14 @@ from hum_ai.data_engine.ingredients import (
 )
 
 # ---------------------------------------------------------------------------
-# 1. Inspect Capella source configuration
+# 1. Capella source configuration and ObservationType mapping
 # ---------------------------------------------------------------------------
 
 capella_info = SOURCE_INFO[CollectionName.CAPELLA]
-print("Capella SOURCE_INFO:")
-print(f"  Band IDs:   {capella_info['band_ids']}")
-print(f"  Band Names: {capella_info['band_names']}")
-print(f"  Resolution: {capella_info['resolution']}m")
-print(f"  Requester Pays: {capella_info['requester_pays']}")
-
-# ---------------------------------------------------------------------------
-# 2. Inspect ObservationType mapping
-# ---------------------------------------------------------------------------
-
 capella_band_map = COLLECTION_BAND_MAP[CollectionName.CAPELLA]
-print("\nCapella band index -> ObservationType:")
-for idx, obs_type in capella_band_map.items():
-    print(f"  Band {idx}: {obs_type.name} ('{obs_type.value}')")
 
 # ---------------------------------------------------------------------------
-# 3. Build a CollectionInput for Capella HH
+# 2. Build a CollectionInput for Capella HH
 # ---------------------------------------------------------------------------
 
 # HH-only input (recommended — matches >98% of available imagery)
@@ -48,22 +40,14 @@ capella_hh_input = CollectionInput(
     band_ids=('HH',),
     resolution=1.0,
 )
-print(f"\nCapella HH CollectionInput:")
-print(f"  Collection: {capella_hh_input.collection_name.id}")
-print(f"  Bands:      {capella_hh_input.band_ids}")
-print(f"  Resolution: {capella_hh_input.resolution}m")
 
 # Default input (all polarizations listed in SOURCE_INFO)
 capella_default_input = CollectionInput(
     collection_name=CollectionName.CAPELLA,
 )
-print(f"\nCapella default CollectionInput:")
-print(f"  Collection: {capella_default_input.collection_name.id}")
-print(f"  Bands:      {capella_default_input.band_ids}")
-print(f"  Resolution: {capella_default_input.resolution}m")
 
 # ---------------------------------------------------------------------------
-# 4. Multi-sensor configuration: Capella + Sentinel-2
+# 3. Multi-sensor configuration: Capella + Sentinel-2
 # ---------------------------------------------------------------------------
 
 # Combine high-res SAR with multispectral optical for complementary analysis.
@@ -81,12 +65,8 @@ multi_sensor_inputs = [
     ),
 ]
 
-print("\nMulti-sensor configuration:")
-for ci in multi_sensor_inputs:
-    print(f"  {ci.collection_name.id}: bands={ci.band_ids}, res={ci.resolution}m")
-
 # ---------------------------------------------------------------------------
-# 5. Multi-sensor configuration: Capella + Sentinel-1 SAR fusion
+# 4. Multi-sensor configuration: Capella + Sentinel-1 SAR fusion
 # ---------------------------------------------------------------------------
 
 # Combine commercial high-res SAR with free broad-area SAR.
@@ -104,17 +84,60 @@ sar_fusion_inputs = [
     ),
 ]
 
-print("\nSAR fusion configuration:")
-for ci in sar_fusion_inputs:
-    print(f"  {ci.collection_name.id}: bands={ci.band_ids}, res={ci.resolution}m")
-
 # ---------------------------------------------------------------------------
-# 6. Compare with Umbra (another commercial high-res SAR)
+# 5. Summary report (also compares with Umbra, another commercial SAR)
 # ---------------------------------------------------------------------------
 
-umbra_info = SOURCE_INFO[CollectionName.UMBRA]
-print("\nCapella vs Umbra comparison:")
-print(f"  Capella - Resolution: {capella_info['resolution']}m, "
-      f"Primary pol: HH, Band IDs: {capella_info['band_ids']}")
-print(f"  Umbra   - Resolution: {umbra_info['resolution']}m, "
-      f"Primary pol: VV, Band IDs: {umbra_info['band_ids']}")
+
+def _describe_input(title: str, ci: CollectionInput) -> list[str]:
+    return [
+        f"\n{title}:",
+        f"  Collection: {ci.collection_name.id}",
+        f"  Bands:      {ci.band_ids}",
+        f"  Resolution: {ci.resolution}m",
+    ]
+
+
+def capella_summary() -> str:
+    """Format the whole configuration summary as one string."""
+    umbra_info = SOURCE_INFO[CollectionName.UMBRA]
+
+    lines = [
+        "Capella SOURCE_INFO:",
+        f"  Band IDs:   {capella_info['band_ids']}",
+        f"  Band Names: {capella_info['band_names']}",
+        f"  Resolution: {capella_info['resolution']}m",
+        f"  Requester Pays: {capella_info['requester_pays']}",
+        "\nCapella band index -> ObservationType:",
+    ]
+    lines += [
+        f"  Band {idx}: {obs_type.name} ('{obs_type.value}')"
+        for idx, obs_type in capella_band_map.items()
+    ]
+    lines += _describe_input("Capella HH CollectionInput", capella_hh_input)
+    lines += _describe_input("Capella default CollectionInput", capella_default_input)
+
+    lines.append("\nMulti-sensor configuration:")
+    lines += [
+        f"  {ci.collection_name.id}: bands={ci.band_ids}, res={ci.resolution}m"
+        for ci in multi_sensor_inputs
+    ]
+    lines.append("\nSAR fusion configuration:")
+    lines += [
+        f"  {ci.collection_name.id}: bands={ci.band_ids}, res={ci.resolution}m"
+        for ci in sar_fusion_inputs
+    ]
+
+    lines += [
+        "\nCapella vs Umbra comparison:",
+        f"  Capella - Resolution: {capella_info['resolution']}m, "
+        f"Primary pol: HH, Band IDs: {capella_info['band_ids']}",
+        f"  Umbra   - Resolution: {umbra_info['resolution']}m, "
+        f"Primary pol: VV, Band IDs: {umbra_info['band_ids']}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    # One buffered write instead of a print() per line
+    sys.stdout.write(capella_summary())
@@ -16,23 +16,36 @@ Usage:
     python cop-dem.py
 
 Requirements:
-    pip install pystac-client planetary-computer odc-stac h3 rioxarray rasterstats shapely
+    pip install pystac-client planetary-computer odc-stac h3 rioxarray rasterio shapely
+
+    Optional, for the on-disk raster cache (summarize_elevation(cache_dir=...)):
+    pip install "zarr>=3" "xarray>=2025.1"
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+import math
 from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import h3
 import numpy as np
-import odc.stac
 import pandas as pd
-import planetary_computer
-import pystac_client
-from rasterstats import zonal_stats
-from shapely.geometry import Polygon
-from shapely.ops import unary_union
+import shapely
+from shapely.geometry import Polygon, box
+from shapely.strtree import STRtree
+
+# odc.stac, pystac-client, planetary-computer and rasterio are imported where
+# they are used, so importing this module for the H3 helpers stays cheap
+if TYPE_CHECKING:
+    import pystac
+    import pystac_client
+    from affine import Affine
+    from rasterio.windows import Window
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -43,6 +56,25 @@ logger = logging.getLogger(__name__)
 
 STAC_CATALOG_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
 
+# Per-request timeout (seconds) so a stalled connection cannot hang a search
+STAC_REQUEST_TIMEOUT = 30
+
+# The only asset the recipe loads; everything else is dropped before signing
+LOADED_ASSETS = ("data",)
+
+# Trim search responses to what odc.stac needs to load the 'data' asset
+# (STAC API fields extension) and request large pages to cut round trips
+STAC_SEARCH_FIELDS = {
+    "include": [
+        "id", "type", "stac_version", "stac_extensions", "collection",
+        "bbox", "geometry", "links",
+        "properties.datetime",
+        "properties.proj:epsg", "properties.proj:shape", "properties.proj:transform",
+        *(f"assets.{key}" for key in LOADED_ASSETS),
+    ],
+}
+STAC_SEARCH_LIMIT = 500
+
 # Planetary Computer hosts two Copernicus DEM collections:
 #   'cop-dem-glo-30' -- 30m (~1 arc-second) posting
 #   'cop-dem-glo-90' -- 90m (~3 arc-second) posting
@@ -52,6 +84,19 @@ STAC_COLLECTION_90M = "cop-dem-glo-90"
 # Default to 30m product
 STAC_COLLECTION = STAC_COLLECTION_30M
 
+# Native pixel size of each collection, in degrees (EPSG:4326)
+NATIVE_RESOLUTION_DEG = {
+    STAC_COLLECTION_30M: 1 / 3600,
+    STAC_COLLECTION_90M: 3 / 3600,
+}
+
+# Approximate length of one degree at the equator, for meters -> degrees
+METERS_PER_DEGREE = 111_320
+
+# Coarse H3 cells are summarized from a raster with about this many pixels
+# per hexagon edge, which GDAL serves from the COG overviews
+PIXELS_PER_HEXAGON_EDGE = 10
+
 # H3 resolution 11 (~2000 m2 cells, ~24.8m spacing) matches 30m pixels well,
 # consistent with the Data Engine's NASADEM configuration.
 DEFAULT_H3_RESOLUTION = 11
@@ -61,20 +106,59 @@ OUTPUT_COLUMNS = ["cell", "elevation_median", "elevation_range"]
 # Copernicus DEM uses 0 as nodata for ocean/void areas
 NODATA_VALUE = 0
 
+# The Copernicus DEM COGs are internally tiled 512x512. Matching dask chunks
+# to the tiles means each chunk is served by whole-tile range requests
+# instead of several partial-tile reads and decodes.
+COG_TILE_SIZE = 512
+
+# GDAL options for reading COGs over HTTP: don't list the remote "directory"
+# on open, only probe .tif URLs, and cache fetched byte ranges.
+GDAL_CLOUD_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif",
+    "VSI_CACHE": "TRUE",
+}
+
+# Pixel size (degrees, ~1 km) of the cheap overview read used to check
+# whether a large area has any land at all before loading it in full
+LAND_PROBE_RESOLUTION_DEG = 0.01
+
+# Rasters up to this many pixels (~64 MB as float32) are materialized in one
+# read; larger rasters are reduced chunk-first so they never have to fit in
+# memory at once.
+GLOBAL_EXTENT_MAX_PIXELS = 4096 * 4096
+
+# On the chunk-first path, cells expected to cover more pixels than this have
+# their median estimated from a random sample of about this many pixels, so
+# memory stays bounded for very large areas. Ranges remain exact.
+MEDIAN_SAMPLE_SIZE = 10_000
+
 
 # ---------------------------------------------------------------------------
-# Helper: convert H3 cells to a unified polygon
+# Helpers: convert H3 cells to Shapely polygons
 # ---------------------------------------------------------------------------
 
 
+def h3_cells_to_polygons(h3_cells: Iterable[str]) -> np.ndarray:
+    """Convert H3 cell IDs to an array of Shapely polygons, one per cell."""
+    boundaries = [h3.cell_to_boundary(cell) for cell in h3_cells]
+    if not boundaries:
+        return np.empty(0, dtype=object)
+
+    # Most cells have 6 vertices, but pentagons and cells crossing icosahedron
+    # edges do not, so build the rings from one flat coordinate array plus a
+    # per-vertex ring index. h3.cell_to_boundary returns (lat, lng) pairs;
+    # Shapely wants (lng, lat).
+    coords = np.concatenate(boundaries)[:, ::-1]
+    ring_index = np.repeat(np.arange(len(boundaries)), [len(b) for b in boundaries])
+    return shapely.polygons(shapely.linearrings(coords, indices=ring_index))
+
+
 def h3_cells_to_polygon(h3_cells: Iterable[str]) -> Polygon:
     """Convert a collection of H3 cell IDs to a single Shapely polygon."""
-    polygons = []
-    for cell in h3_cells:
-        # h3.cell_to_boundary returns (lat, lng) pairs; Shapely wants (lng, lat)
-        lonlats = [(lng, lat) for (lat, lng) in h3.cell_to_boundary(cell)]
-        polygons.append(Polygon(lonlats))
-    return unary_union(polygons)
+    # H3 cells tile the sphere without overlapping, so they form a valid
+    # polygonal coverage and can use GEOS's much cheaper coverage union
+    return shapely.coverage_union_all(h3_cells_to_polygons(h3_cells))
 
 
 # ---------------------------------------------------------------------------
@@ -82,6 +166,34 @@ def h3_cells_to_polygon(h3_cells: Iterable[str]) -> Polygon:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4)
+def get_catalog(url: str = STAC_CATALOG_URL) -> pystac_client.Client:
+    """Open a STAC client once per URL and reuse it for later searches."""
+    import pystac_client
+
+    return pystac_client.Client.open(url, timeout=STAC_REQUEST_TIMEOUT)
+
+
+def _sign_item(item: pystac.Item) -> pystac.Item:
+    """
+    Return a copy of ``item`` with only the LOADED_ASSETS, their hrefs
+    signed. Assets the recipe never reads are neither kept nor signed.
+    """
+    import planetary_computer
+
+    signed = item.clone()
+    signed.assets = {
+        key: asset for key, asset in signed.assets.items() if key in LOADED_ASSETS
+    }
+
+    # planetary_computer keeps one SAS token per storage container and renews
+    # it shortly before it expires, so after the first item this is a local
+    # string operation and never hands out a token that is about to lapse
+    for asset in signed.assets.values():
+        asset.href = planetary_computer.sign(asset.href)
+    return signed
+
+
 def search_copdem_tiles(
     bbox: tuple[float, float, float, float],
     collection: str = STAC_COLLECTION,
@@ -106,16 +218,17 @@ def search_copdem_tiles(
     pystac.ItemCollection
         Matched STAC items
     """
-    catalog = pystac_client.Client.open(
-        STAC_CATALOG_URL,
-        modifier=planetary_computer.sign_inplace,
-    )
+    import pystac
 
+    catalog = get_catalog()
     search = catalog.search(
         collections=[collection],
         bbox=bbox,
+        fields=STAC_SEARCH_FIELDS,
+        limit=STAC_SEARCH_LIMIT,
     )
-    items = search.item_collection()
+
+    items = pystac.ItemCollection(_sign_item(item) for item in search.items())
     logger.info("STAC search returned %d Copernicus DEM items from '%s'",
                 len(items), collection)
     return items
@@ -126,7 +239,28 @@ def search_copdem_tiles(
 # ---------------------------------------------------------------------------
 
 
-def load_copdem_raster(items, bbox: tuple[float, float, float, float]):
+def load_resolution_for_cells(h3_resolution: int, collection: str = STAC_COLLECTION) -> float | None:
+    """
+    Pixel size (degrees) to load for cells at ``h3_resolution``, or None to
+    load at the collection's native posting.
+
+    Cells much larger than a pixel (roughly H3 resolution 8 and coarser for
+    GLO-30) don't need full-resolution reads; loading at a coarser pixel size
+    lets GDAL read from the COG overviews, which cuts bytes read by ~4x per
+    overview level.
+    """
+    edge_m = h3.average_hexagon_edge_length(h3_resolution, unit="m")
+    pixel_deg = edge_m / PIXELS_PER_HEXAGON_EDGE / METERS_PER_DEGREE
+    if pixel_deg <= NATIVE_RESOLUTION_DEG[collection]:
+        return None
+    return pixel_deg
+
+
+def load_copdem_raster(
+    items,
+    bbox: tuple[float, float, float, float],
+    resolution: float | None = None,
+):
     """
     Load Copernicus DEM tiles as a dask-backed xarray DataArray.
 
@@ -136,24 +270,35 @@ def load_copdem_raster(items, bbox: tuple[float, float, float, float]):
         STAC items from the search step
     bbox : tuple
         (west, south, east, north) to spatially subset the load
+    resolution : float, optional
+        Output pixel size in degrees. Defaults to the native posting; a
+        coarser value is read from the COG overviews.
 
     Returns
     -------
     xarray.DataArray
-        Elevation values (meters above EGM2008 geoid) with nodata handling
+        Elevation values (meters above EGM2008 geoid) in the native dtype,
+        with NODATA_VALUE recorded as nodata rather than masked to NaN
     """
+    import odc.stac
+
+    # Copernicus DEM uses 0 for ocean/void. Declaring it as nodata keeps the
+    # native dtype and avoids a full-raster .where() pass; the zonal step
+    # excludes nodata pixels itself.
+    odc.stac.configure_rio(**GDAL_CLOUD_OPTIONS)
     data = odc.stac.load(
         items,
-        chunks={"x": 128, "y": 128},
+        chunks={"x": COG_TILE_SIZE, "y": COG_TILE_SIZE},
         bbox=bbox,
         bands=["data"],  # Copernicus DEM band name is 'data'
+        nodata=NODATA_VALUE,
+        resolution=resolution,  # None keeps the native posting
     )
 
-    # The loaded dataset has a 'data' variable containing elevation
-    data = data["data"]
-
-    # Handle nodata -- Copernicus DEM uses 0 for ocean/void
-    data = data.where(data != NODATA_VALUE, np.nan)
+    # The loaded dataset has a 'data' variable containing elevation. The DEM
+    # is static (every tile shares one timestamp), so drop the singleton
+    # time dimension to get a plain (y, x) raster.
+    data = data["data"].squeeze("time", drop=True)
 
     logger.info(
         "Loaded raster: shape=%s, CRS=%s", data.shape, data.rio.crs
@@ -161,31 +306,296 @@ def load_copdem_raster(items, bbox: tuple[float, float, float, float]):
     return data
 
 
+def raster_cache_path(
+    cache_dir: str | Path,
+    collection: str,
+    bbox: tuple[float, float, float, float],
+    resolution: float | None,
+) -> Path:
+    """Zarr store path for a (collection, bbox, resolution) load."""
+    key = hashlib.sha1(repr((collection, tuple(bbox), resolution)).encode()).hexdigest()
+    return Path(cache_dir) / f"copdem_{key[:16]}.zarr"
+
+
+def write_raster_cache(data, path: Path):
+    """
+    Persist a loaded DEM raster to a local Zarr store and reopen it from there.
+
+    Zarr chunks match the dask chunks (COG_TILE_SIZE) and are compressed with
+    zstd level 3, which shrinks elevation data roughly threefold. Later runs
+    over the same area read this store instead of the remote COGs.
+    """
+    import xarray as xr
+    from zarr.codecs import BloscCodec
+
+    data.to_dataset(name="data").to_zarr(
+        path,
+        mode="w",
+        encoding={"data": {
+            "chunks": (COG_TILE_SIZE, COG_TILE_SIZE),
+            "compressors": (BloscCodec(cname="zstd", clevel=3),),
+        }},
+    )
+    logger.info("Cached raster to %s", path)
+    return xr.open_zarr(path)["data"]
+
+
+def read_raster_cache(path: Path):
+    """Open a raster written by write_raster_cache as a dask-backed DataArray."""
+    import xarray as xr
+
+    return xr.open_zarr(path)["data"]
+
+
+def has_valid_elevation(items, bbox: tuple[float, float, float, float]) -> bool:
+    """
+    Whether any Copernicus DEM pixel in ``bbox`` is valid (not ocean/void).
+
+    Reads the area once at LAND_PROBE_RESOLUTION_DEG, which GDAL serves from
+    the coarsest COG overviews. Average resampling ignores nodata sources, so
+    a probe pixel is only nodata when everything beneath it is.
+    """
+    import odc.stac
+
+    odc.stac.configure_rio(**GDAL_CLOUD_OPTIONS)
+    probe = odc.stac.load(
+        items,
+        bbox=bbox,
+        bands=["data"],
+        nodata=NODATA_VALUE,
+        resolution=LAND_PROBE_RESOLUTION_DEG,
+        resampling="average",
+    )["data"]
+    return bool((probe.values != NODATA_VALUE).any())
+
+
 # ---------------------------------------------------------------------------
 # Step 3: Compute zonal statistics per H3 cell
 # ---------------------------------------------------------------------------
 
 
+def _polygon_window(poly: Polygon, transform: Affine, shape: tuple[int, int]) -> Window | None:
+    """
+    Pixel window of ``poly``'s bounding box within a block, or None if the
+    polygon falls entirely outside it. Equivalent to the bbox-to-pixel-offset
+    step of a local-extent zonal statistics implementation; kept identical to
+    ``_polygon_window`` in nasadem.py.
+    """
+    from rasterio.windows import Window, from_bounds
+
+    # Round each end outward separately: flooring the offset and then
+    # ceiling only the fractional length can stop one pixel short of the
+    # bbox's far edge and drop that row/column of the cell
+    window = from_bounds(*poly.bounds, transform=transform)
+    row_start = max(math.floor(window.row_off), 0)
+    col_start = max(math.floor(window.col_off), 0)
+    row_stop = min(math.ceil(window.row_off + window.height), shape[0])
+    col_stop = min(math.ceil(window.col_off + window.width), shape[1])
+    if row_stop <= row_start or col_stop <= col_start:
+        return None
+    return Window.from_slices((row_start, row_stop), (col_start, col_stop))
+
+
+def _block_cell_pixels(
+    block: np.ndarray,
+    transform: Affine,
+    polygons: np.ndarray,
+    hits: Iterable[int],
+    all_touched: bool,
+    nodata: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collect the valid pixels of one raster block for every polygon that
+    intersects it.
+
+    With all_touched=False the H3 cells cannot share a pixel, so every hit is
+    burned into one int32 label raster in a single rasterize call. With
+    all_touched=True neighbouring cells do share their edge pixels, which a
+    label raster cannot represent, so each polygon is rasterized separately
+    over its own bounding-box window instead.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (polygon index per pixel, pixel value)
+    """
+    from affine import Affine
+    from rasterio.features import rasterize
+
+    if not all_touched:
+        labels = rasterize(
+            ((polygons[idx], idx + 1) for idx in hits),
+            out_shape=block.shape,
+            transform=transform,
+            fill=0,
+            all_touched=False,
+            dtype="int32",
+        )
+        valid = (labels > 0) & (block != nodata)
+        return labels[valid].astype(np.int64) - 1, block[valid]
+
+    indices, values = [], []
+    for idx in hits:
+        window = _polygon_window(polygons[idx], transform, block.shape)
+        if window is None:
+            continue
+        row_slice, col_slice = window.toslices()
+        local = block[row_slice, col_slice]
+        mask = rasterize(
+            [(polygons[idx], 1)],
+            out_shape=local.shape,
+            transform=transform * Affine.translation(window.col_off, window.row_off),
+            fill=0,
+            all_touched=True,
+            dtype="uint8",
+        ).astype(bool)
+        pixels = local[mask]
+        pixels = pixels[pixels != nodata]
+        if pixels.size:
+            indices.append(np.full(pixels.size, idx, dtype=np.int64))
+            values.append(pixels)
+
+    if not values:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=block.dtype)
+    return np.concatenate(indices), np.concatenate(values)
+
+
+def _min_max_by_index(
+    indices: np.ndarray,
+    values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-index minimum and maximum of ``values``: (unique indices, min, max)."""
+    order = np.argsort(indices, kind="stable")
+    indices, values = indices[order], values[order]
+    groups, starts = np.unique(indices, return_index=True)
+    return groups, np.minimum.reduceat(values, starts), np.maximum.reduceat(values, starts)
+
+
+def _chunked_cell_pixels(
+    data,
+    polygons: np.ndarray,
+    all_touched: bool,
+    sample_rates: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, tuple[np.ndarray, np.ndarray] | None]:
+    """
+    Collect per-polygon pixels chunk-first: every dask block that intersects
+    at least one polygon is computed exactly once, and blocks no polygon
+    touches are never read.
+
+    With ``sample_rates`` (one probability per polygon), each pixel is kept
+    with its cell's rate, and every cell's exact minimum and maximum are
+    tracked on the side from the full blocks. The extremes are kept out of
+    the sample so they cannot pull the median towards the midrange.
+
+    Returns
+    -------
+    tuple
+        (polygon index per pixel, pixel value, extremes), where extremes is
+        None without sampling, else (per-polygon minimum, maximum) arrays,
+        +inf/-inf for polygons with no valid pixels
+    """
+    from affine import Affine
+    from rasterio.transform import array_bounds
+
+    tree = STRtree(polygons)
+    raster = data.data
+    transform = data.rio.transform()
+    row_offsets = np.cumsum((0,) + raster.chunks[0])
+    col_offsets = np.cumsum((0,) + raster.chunks[1])
+
+    rng = np.random.default_rng(0)
+    indices, values = [], []
+    if sample_rates is not None:
+        cell_min = np.full(len(polygons), np.inf)
+        cell_max = np.full(len(polygons), -np.inf)
+    blocks = raster.to_delayed()
+    for iy, ix in np.ndindex(*blocks.shape):
+        height, width = raster.chunks[0][iy], raster.chunks[1][ix]
+        block_transform = transform * Affine.translation(
+            col_offsets[ix], row_offsets[iy]
+        )
+        hits = tree.query(box(*array_bounds(height, width, block_transform)))
+        if len(hits) == 0:
+            continue
+
+        block_indices, block_values = _block_cell_pixels(
+            blocks[iy, ix].compute(), block_transform, polygons, hits,
+            all_touched, NODATA_VALUE,
+        )
+        if sample_rates is not None and block_values.size:
+            groups, mins, maxs = _min_max_by_index(block_indices, block_values)
+            np.minimum.at(cell_min, groups, mins)
+            np.maximum.at(cell_max, groups, maxs)
+            keep = rng.random(block_values.size) < sample_rates[block_indices]
+            block_indices, block_values = block_indices[keep], block_values[keep]
+        indices.append(block_indices)
+        values.append(block_values)
+
+    extremes = None if sample_rates is None else (cell_min, cell_max)
+    if not indices:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=raster.dtype), extremes
+    return np.concatenate(indices), np.concatenate(values), extremes
+
+
+def _median_range_by_index(
+    indices: np.ndarray,
+    values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-index median and range of ``values`` from a single sort.
+
+    Sorting by (index, value) makes every group a contiguous, ordered run, so
+    the minimum, maximum and middle elements of all groups are picked out
+    with vectorized indexing rather than a Python loop over groups.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (unique indices, median, range)
+    """
+    order = np.lexsort((values, indices))
+    indices, values = indices[order], values[order].astype(np.float64)
+    groups, starts, counts = np.unique(indices, return_index=True, return_counts=True)
+
+    lower = starts + (counts - 1) // 2
+    upper = starts + counts // 2
+    median = (values[lower] + values[upper]) / 2
+    value_range = values[starts + counts - 1] - values[starts]
+    return groups, median, value_range
+
+
 def compute_elevation_stats(
     data,
     h3_cells: list[str],
     default_h3_resolution: int = DEFAULT_H3_RESOLUTION,
+    polygons: np.ndarray | None = None,
 ) -> pd.DataFrame:
     """
     Compute elevation median and range for each H3 cell from Copernicus DEM.
 
-    This follows the same pattern as the Data Engine's ElevationAncillaryData
-    (which uses NASADEM), adapted for Copernicus DEM.
+    This produces the same statistics as the Data Engine's
+    ElevationAncillaryData (which uses NASADEM), without rasterizing and
+    summarizing cells one at a time. Pixels are labelled with the index of
+    the H3 cell that contains them and reduced with one sort-based groupby.
+    Rasters no larger than GLOBAL_EXTENT_MAX_PIXELS are read in one go;
+    larger rasters are reduced chunk-first, reading each dask block that
+    intersects a cell exactly once. Cells that straddle a block boundary are
+    handled naturally by the groupby. On the chunk-first path, cells expected
+    to cover more than MEDIAN_SAMPLE_SIZE pixels get a sampled (approximate)
+    median; the range is always exact.
 
     Parameters
     ----------
     data : xarray.DataArray
-        The loaded Copernicus DEM raster
+        The loaded Copernicus DEM raster (EPSG:4326, the native CRS)
     h3_cells : list of str
         H3 cell IDs to summarize
     default_h3_resolution : int
         The H3 resolution that matches the raster pixel spacing.
         Cells finer than this use all_touched=True.
+    polygons : np.ndarray, optional
+        Cell polygons from h3_cells_to_polygons, if the caller already has
+        them; otherwise they are built here.
 
     Returns
     -------
@@ -200,36 +610,48 @@ def compute_elevation_stats(
     else:
         all_touched = False
 
-    nodata = NODATA_VALUE
-
-    results = []
-    for cell in h3_cells:
-        boundary = h3.cell_to_boundary(cell)
-        poly = Polygon([(lng, lat) for lat, lng in boundary])
-
-        try:
-            subset = data.rio.clip(geometries=[poly], crs="EPSG:4326")
-        except Exception:
-            # Cell has no data coverage (e.g., over ocean)
-            continue
+    if polygons is None:
+        polygons = h3_cells_to_polygons(h3_cells)
 
-        summary = zonal_stats(
-            [poly],
-            subset.to_numpy(),
-            affine=subset.rio.transform(),
-            nodata=nodata,
-            stats=["median", "range"],
-            all_touched=all_touched,
-        )[0]
-
-        if None not in summary.values():
-            results.append({
-                "cell": cell,
-                "elevation_median": summary["median"],
-                "elevation_range": summary["range"],
-            })
-
-    df = pd.DataFrame(results, columns=OUTPUT_COLUMNS)
+    if data.size <= GLOBAL_EXTENT_MAX_PIXELS:
+        # Small area: one read of the whole extent
+        indices, values = _block_cell_pixels(
+            data.to_numpy(), data.rio.transform(), polygons,
+            range(len(polygons)), all_touched, NODATA_VALUE,
+        )
+        extremes = None
+    else:
+        # Expected pixels per cell from its own area, so a few cells spread
+        # over a large bbox are not sampled as if they filled it
+        transform = data.rio.transform()
+        cell_pixels = shapely.area(polygons) / abs(transform.a * transform.e)
+        sample_rates = np.minimum(1.0, MEDIAN_SAMPLE_SIZE / np.maximum(cell_pixels, 1.0))
+        indices, values, extremes = _chunked_cell_pixels(
+            data, polygons, all_touched,
+            sample_rates=sample_rates if (sample_rates < 1.0).any() else None,
+        )
+
+    if extremes is None:
+        groups, median, value_range = _median_range_by_index(indices, values)
+    else:
+        cell_min, cell_max = extremes
+        # A cell whose pixels were all dropped by sampling falls back to its
+        # exact extremes as the sample
+        missing = np.setdiff1d(np.flatnonzero(np.isfinite(cell_min)), indices)
+        if missing.size:
+            indices = np.concatenate([indices, missing, missing])
+            values = np.concatenate([
+                values, cell_min[missing].astype(values.dtype),
+                cell_max[missing].astype(values.dtype),
+            ])
+        groups, median, _ = _median_range_by_index(indices, values)
+        value_range = cell_max[groups] - cell_min[groups]
+
+    df = pd.DataFrame({
+        "cell": np.asarray(h3_cells, dtype=object)[groups],
+        "elevation_median": median,
+        "elevation_range": value_range,
+    }, columns=OUTPUT_COLUMNS)
     logger.info("Computed elevation stats for %d / %d cells",
                 len(df), len(h3_cells))
     return df
@@ -243,6 +665,7 @@ def compute_elevation_stats(
 def summarize_elevation(
     h3_cells: list[str],
     collection: str = STAC_COLLECTION,
+    cache_dir: str | Path | None = None,
 ) -> pd.DataFrame:
     """
     End-to-end pipeline: search, load, and summarize Copernicus DEM elevation
@@ -250,17 +673,45 @@ def summarize_elevation(
 
     Unlike NASADEM (which has ElevationAncillaryData in the data-engine),
     Copernicus DEM must be accessed via direct STAC queries as shown here.
+
+    If ``cache_dir`` is given, the loaded raster is persisted there as Zarr
+    and repeated calls over the same area and resolution skip STAC and the
+    remote reads entirely.
     """
-    polygon = h3_cells_to_polygon(h3_cells)
-    bbox = polygon.bounds
+    # Build the cell polygons once; they give the search bbox and are reused
+    # by the zonal statistics step. Only the bounds are needed, so take them
+    # straight from the polygon array rather than unioning the cells.
+    polygons = h3_cells_to_polygons(h3_cells)
+    bbox = tuple(shapely.total_bounds(polygons).tolist())
+    resolution = load_resolution_for_cells(h3.get_resolution(h3_cells[0]), collection)
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = raster_cache_path(cache_dir, collection, bbox, resolution)
+        if cache_path.exists():
+            logger.info("Reading cached raster from %s", cache_path)
+            data = read_raster_cache(cache_path)
+            return compute_elevation_stats(data, h3_cells, polygons=polygons)
 
     items = search_copdem_tiles(bbox, collection=collection)
     if len(items) == 0:
         logger.warning("No Copernicus DEM tiles found for the given area")
         return pd.DataFrame(columns=OUTPUT_COLUMNS)
 
-    data = load_copdem_raster(items, bbox)
-    df = compute_elevation_stats(data, h3_cells)
+    # Coastal areas can be entirely ocean (nodata). For anything bigger than
+    # a single in-memory read, check a coarse overview first and skip the
+    # full load when there is no land.
+    pixel_size = resolution or NATIVE_RESOLUTION_DEG[collection]
+    west, south, east, north = bbox
+    n_pixels = ((east - west) / pixel_size) * ((north - south) / pixel_size)
+    if n_pixels > GLOBAL_EXTENT_MAX_PIXELS and not has_valid_elevation(items, bbox):
+        logger.info("Area is entirely Copernicus DEM nodata (ocean/void)")
+        return pd.DataFrame(columns=OUTPUT_COLUMNS)
+
+    data = load_copdem_raster(items, bbox, resolution=resolution)
+    if cache_path is not None:
+        data = write_raster_cache(data, cache_path)
+    df = compute_elevation_stats(data, h3_cells, polygons=polygons)
     return df
 
 
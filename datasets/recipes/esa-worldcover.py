@@ -22,18 +22,44 @@ ESA WorldCover class values (map band):
     100 = Moss and lichen
 """
 
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
 import numpy as np
-import odc.stac
 
-from hum_ai.data_engine.collections import CollectionName
-from hum_ai.data_engine.ingredients import COLLECTION_BAND_MAP, SOURCE_INFO
-from hum_ai.stac.search import get_client
+# odc.stac and the hum_ai data-engine modules are imported where they are
+# used, so compute_class_fractions can be imported without them
+if TYPE_CHECKING:
+    from hum_ai.data_engine.collections import CollectionName
+
+# Trim search responses to what odc.stac needs to load the 'map' asset
+# (STAC API fields extension) and request large pages to cut round trips
+STAC_SEARCH_FIELDS = {
+    "include": [
+        "id", "type", "stac_version", "stac_extensions", "collection",
+        "bbox", "geometry", "links",
+        "properties.datetime",
+        "properties.proj:epsg", "properties.proj:shape", "properties.proj:transform",
+        "assets.map",
+    ],
+}
+STAC_SEARCH_LIMIT = 500
 
 
 # ---------------------------------------------------------------------------
 # 1. Search for ESA WorldCover items covering a bounding box
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=4)
+def _get_catalog(collection: CollectionName):
+    """Open the STAC client for a collection once and reuse it."""
+    from hum_ai.stac.search import get_client
+
+    return get_client(collection)
+
+
 def search_worldcover_items(bbox: tuple[float, float, float, float]):
     """Search for ESA WorldCover items over a bounding box.
 
@@ -43,10 +69,14 @@ def search_worldcover_items(bbox: tuple[float, float, float, float]):
     Returns:
         pystac ItemCollection of matching WorldCover tiles.
     """
-    catalog = get_client(CollectionName.ESA_WORLDCOVER)
+    from hum_ai.data_engine.collections import CollectionName
+
+    catalog = _get_catalog(CollectionName.ESA_WORLDCOVER)
     search = catalog.search(
         collections=[CollectionName.ESA_WORLDCOVER.id],
         bbox=bbox,
+        fields=STAC_SEARCH_FIELDS,
+        limit=STAC_SEARCH_LIMIT,
     )
     items = search.item_collection()
     print(f"Found {len(items)} ESA WorldCover items for bbox {bbox}")
@@ -73,6 +103,11 @@ def load_worldcover_map(
     Returns:
         xarray.Dataset with the 'map' band containing class values.
     """
+    import odc.stac
+
+    from hum_ai.data_engine.collections import CollectionName
+    from hum_ai.data_engine.ingredients import SOURCE_INFO
+
     items = search_worldcover_items(bbox)
     if len(items) == 0:
         raise ValueError(f"No WorldCover items found for bbox {bbox}")
@@ -86,6 +121,8 @@ def load_worldcover_map(
         crs=crs,
         bands=[band_info["band_ids"][0]],  # 'map' band only
         resampling="nearest",  # categorical data requires nearest-neighbor
+        dtype="uint8",  # class codes fit in a byte; keeps np.bincount cheap
+        nodata=0,
     )
     if resolution is not None:
         load_kwargs["resolution"] = resolution
@@ -114,6 +151,9 @@ WORLDCOVER_CLASSES = {
     100: "Moss and lichen",
 }
 
+# Class values that count towards the fraction denominator (all but No Data)
+VALID_CLASS_CODES = np.array([value for value in WORLDCOVER_CLASSES if value != 0])
+
 
 def compute_class_fractions(classification: np.ndarray) -> dict[str, float]:
     """Compute the fractional area of each land cover class.
@@ -124,9 +164,23 @@ def compute_class_fractions(classification: np.ndarray) -> dict[str, float]:
     Returns:
         Dictionary mapping class name to fraction of valid pixels.
     """
-    # Exclude no-data pixels from the denominator
-    valid_mask = classification != 0
-    total_valid = valid_mask.sum()
+    classification = np.asarray(classification)
+    n_bins = max(WORLDCOVER_CLASSES) + 1
+
+    if np.issubdtype(classification.dtype, np.unsignedinteger):
+        # One histogram pass over the raster instead of one scan per class
+        counts = np.bincount(classification.ravel(), minlength=n_bins)
+    else:
+        # np.bincount needs non-negative integers; other dtypes (e.g. a float
+        # raster with NaN nodata) are counted in one np.unique pass instead
+        values, value_counts = np.unique(classification, return_counts=True)
+        known = np.isin(values, list(WORLDCOVER_CLASSES))
+        counts = np.zeros(n_bins, dtype=np.int64)
+        counts[values[known].astype(np.intp)] = value_counts[known]
+
+    # Only known classes form the denominator, so no-data and any stray
+    # values the bincount path also tallied are excluded on both paths
+    total_valid = counts[VALID_CLASS_CODES].sum()
 
     if total_valid == 0:
         return {name: 0.0 for name in WORLDCOVER_CLASSES.values()}
@@ -135,8 +189,7 @@ def compute_class_fractions(classification: np.ndarray) -> dict[str, float]:
     for value, name in WORLDCOVER_CLASSES.items():
         if value == 0:
             continue
-        count = (classification == value).sum()
-        fractions[name] = float(count / total_valid)
+        fractions[name] = float(counts[value] / total_valid)
 
     return fractions
 
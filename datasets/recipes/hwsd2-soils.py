@@ -11,15 +11,51 @@ HWSD2 is a classified raster with a CSV lookup table:
 
 The Data Engine extracts four properties:
   sand (%)  |  clay (%)  |  organic_carbon (g/kg)  |  total_nitrogen (g/kg)
+
+Requirements:
+    pip install h3 numpy pandas pyarrow rasterio
+
+    Optional, for vectorized grid_disk over large footprints:
+    pip install h3ronpy
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import math
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import h3
+import numpy as np
 import pandas as pd
 
 from hum_ai.data_engine.ancillary.soils import METADATA, SoilsAncillaryData
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import rasterio
+    from affine import Affine
+
+# Local Parquet copy of HWSD2_LAYERS.csv, written the first time it is read
+HWSD2_CACHE_DIR = Path.home() / ".cache" / "hum_ai" / "hwsd2"
+
+# Pre-computed per-cell attribute shards, one Parquet file per coarse parent
+HWSD2_SHARD_DIR = HWSD2_CACHE_DIR / "shards"
+SHARD_H3_RESOLUTION = 5  # ~250 km2 parents
+SHARD_CELL_RESOLUTION = 8  # ~0.74 km2 cells, about one HWSD2 pixel
+SHARD_COLUMNS = ("sand", "clay", "organic_carbon", "total_nitrogen")
+
+# GDAL settings for small windowed reads of the remote HWSD2 raster
+HWSD2_GDAL_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif",
+    "VSI_CACHE": "TRUE",
+}
+
 
 # ---------------------------------------------------------------------------
 # 1. Inspect HWSD2 metadata
@@ -41,11 +77,66 @@ for col, unit in METADATA['units'].items():
 # 2. Basic usage -- summarize soil properties for a set of H3 cells
 # ---------------------------------------------------------------------------
 
+def _h3ronpy_vector():
+    """h3ronpy's vectorized (grid_disk, cells_to_string), or None if absent.
+
+    The functions moved from ``h3ronpy.arrow.vector`` to the package root in
+    h3ronpy 0.22; either location is accepted.
+    """
+    try:
+        from h3ronpy import cells_to_string, grid_disk
+    except ImportError:
+        try:
+            from h3ronpy.arrow.vector import cells_to_string, grid_disk
+        except ImportError:
+            return None
+    return grid_disk, cells_to_string
+
+
+def grid_disk_cells(center_cells: np.ndarray, k: int) -> np.ndarray:
+    """All H3 cells within ``k`` rings of any center, as a sorted uint64 array.
+
+    With h3ronpy installed, its vectorized (Rust/Arrow) grid_disk runs over
+    the whole array of centers, so large footprints don't allocate a Python
+    object per cell; otherwise each center goes through ``h3.grid_disk``.
+    Overlapping disks are deduplicated.
+    """
+    center_cells = np.asarray(center_cells, dtype=np.uint64)
+    vector = _h3ronpy_vector()
+    if vector is not None:
+        disks = vector[0](center_cells, k, flatten=True)
+        return np.unique(np.asarray(disks))
+    return np.unique(np.fromiter(
+        (
+            h3.str_to_int(cell)
+            for center in center_cells.tolist()
+            for cell in h3.grid_disk(h3.int_to_str(center), k)
+        ),
+        dtype=np.uint64,
+    ))
+
+
+def cells_to_strings(cell_ids: np.ndarray) -> list[str]:
+    """Convert uint64 H3 cells to hex string IDs, in one call with h3ronpy."""
+    cell_ids = np.asarray(cell_ids, dtype=np.uint64)
+    vector = _h3ronpy_vector()
+    if vector is None:
+        return [h3.int_to_str(cell) for cell in cell_ids.tolist()]
+
+    import pyarrow as pa
+
+    # h3ronpy returns an Arrow-compatible array; read it back through pyarrow
+    return pa.array(vector[1](cell_ids)).to_pylist()
+
+
 # Example: generate H3 cells covering a small area in Iowa (agricultural land)
 # H3 resolution 8 gives cells of ~0.74 km2, appropriate for ~1 km HWSD2 data
 iowa_lat, iowa_lng = 42.0, -93.5
-example_cell = h3.latlng_to_cell(iowa_lat, iowa_lng, res=8)
-h3_cells = list(h3.grid_disk(example_cell, k=2))  # center cell + 2 rings
+example_cell = h3.str_to_int(h3.latlng_to_cell(iowa_lat, iowa_lng, res=8))
+cell_ids = grid_disk_cells(np.array([example_cell], dtype=np.uint64), k=2)  # center + 2 rings
+
+# SoilsAncillaryData takes string cell IDs; convert once, at the boundary
+h3_cells = cells_to_strings(cell_ids)
 
 print(f"\nExample: {len(h3_cells)} H3 cells around ({iowa_lat}, {iowa_lng})")
 
@@ -73,26 +164,197 @@ print(result.to_string(index=False))
 # 4. Accessing the full lookup table for additional attributes
 # ---------------------------------------------------------------------------
 
-def load_full_hwsd2_table() -> pd.DataFrame:
-    """Load the complete HWSD2 lookup table with all 48 attributes.
+@functools.lru_cache(maxsize=1)
+def _hwsd2_layers_table() -> pa.Table:
+    """The full HWSD2 lookup table as an Arrow table, read once per process.
+
+    The first read parses the CSV with PyArrow's multi-threaded reader,
+    streamed through Arrow's own filesystem layer (S3 included), and writes
+    a ZSTD-compressed, dictionary-encoded Parquet copy to HWSD2_CACHE_DIR.
+    Later runs read that copy instead. The cache file name includes the
+    source object's size and modification time, so a new upstream CSV gets a
+    fresh copy.
+    """
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+    from pyarrow import fs as pafs
+
+    source = METADATA['s3_table_path']
+    filesystem, path = pafs.FileSystem.from_uri(source)
+    info = filesystem.get_file_info(path)
+    key = hashlib.md5(f"{source}|{info.size}|{info.mtime_ns}".encode()).hexdigest()
+    cache_path = HWSD2_CACHE_DIR / f"layers-{key[:16]}.parquet"
+
+    if cache_path.exists():
+        return pq.read_table(cache_path)
+
+    with filesystem.open_input_stream(path) as stream:
+        table = pacsv.read_csv(
+            stream,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        )
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = cache_path.with_suffix(".parquet.partial")
+    pq.write_table(table, partial_path, compression="zstd", use_dictionary=True)
+    partial_path.replace(cache_path)  # atomic, so readers never see half a file
+    return table
+
+
+def load_full_hwsd2_table(columns: Sequence[str] | None = None) -> pd.DataFrame:
+    """Load the HWSD2 lookup table, optionally only some of its 48 attributes.
 
     Use this when you need attributes beyond the four that the Data Engine
     extracts by default (sand, clay, organic_carbon, total_nitrogen).
+
+    The table is downloaded and parsed once, then cached on local disk as
+    Parquet and in memory (see _hwsd2_layers_table). Passing ``columns``
+    selects from the cached Arrow table without copying, so only those
+    attributes are converted to pandas.
+
+    Args:
+        columns: HWSD2 column names to load, e.g.
+            ``["HWSD2_SMU_ID", "SAND", "CLAY", "ORG_CARBON", "TOTAL_N"]``.
+            Defaults to all columns.
     """
-    df = pd.read_csv(METADATA['s3_table_path'], low_memory=False)
-    return df
+    table = _hwsd2_layers_table()
+    if columns is not None:
+        table = table.select(list(columns))
+    return table.to_pandas()
 
 
 # Uncomment to inspect:
 # full_table = load_full_hwsd2_table()
 # print(f"\nFull table shape: {full_table.shape}")
 # print(f"Available columns:\n  {full_table.columns.tolist()}")
+#
+# Or load only the attributes you need:
+# texture = load_full_hwsd2_table(columns=["HWSD2_SMU_ID", "SAND", "SILT", "CLAY"])
+
+
+# ---------------------------------------------------------------------------
+# 5. Direct-addressed SMU lookups for raster pixels
+# ---------------------------------------------------------------------------
+
+# Lookup-table attributes gathered per SMU: output name -> HWSD2 column
+SMU_LOOKUP_COLUMNS = {
+    "sand": "SAND",
+    "clay": "CLAY",
+    "organic_carbon": "ORG_CARBON",
+    "total_nitrogen": "TOTAL_N",
+    # Needed for carbon stock (see apply_soil_metrics)
+    "bulk_density": "BULK",
+    "coarse_fragments": "COARSE",  # volume %
+    "top_depth": "TOPDEP",  # cm
+    "bottom_depth": "BOTDEP",  # cm
+}
+
+
+@functools.lru_cache(maxsize=1)
+def smu_lookup_arrays() -> dict[str, np.ndarray]:
+    """Build one read-only float32 array per attribute, indexed by SMU ID.
+
+    Raster SMU codes can then be decoded with plain fancy indexing
+    (``arrays["sand"][smu_codes]``) instead of a pandas merge or ``.map``
+    per pixel. Values come from the topsoil layer (D1) of each SMU's
+    dominant soil unit (SEQUENCE 1). HWSD2's negative missing-value codes,
+    and SMU IDs absent from the table, are NaN.
+    """
+    table = load_full_hwsd2_table(
+        columns=["HWSD2_SMU_ID", "SEQUENCE", "LAYER", *SMU_LOOKUP_COLUMNS.values()]
+    )
+    table = table[(table["LAYER"] == "D1") & (table["SEQUENCE"] == 1)]
+    smu_ids = table["HWSD2_SMU_ID"].to_numpy()
+
+    arrays = {}
+    for name, column in SMU_LOOKUP_COLUMNS.items():
+        values = table[column].to_numpy(dtype=np.float32)
+        lookup = np.full(smu_ids.max() + 1, np.nan, dtype=np.float32)
+        lookup[smu_ids] = np.where(values < 0, np.nan, values)
+        lookup.flags.writeable = False
+        arrays[name] = lookup
+    return arrays
+
+
+def lookup_smu_attributes(smu_codes: np.ndarray) -> dict[str, np.ndarray]:
+    """Decode an array of raster SMU codes into soil attribute arrays.
+
+    Args:
+        smu_codes: Integer SMU codes of any shape (e.g. an HWSD2 raster window).
+
+    Returns:
+        Dictionary mapping each SMU_LOOKUP_COLUMNS name to a float32 array of
+        the same shape as ``smu_codes``. Unknown or nodata codes give NaN.
+    """
+    arrays = smu_lookup_arrays()
+    codes = np.asarray(smu_codes)
+    size = len(arrays["sand"])
+    known = (codes >= 0) & (codes < size)
+    safe_codes = np.where(known, codes, 0)
+    return {
+        name: np.where(known, lookup[safe_codes], np.nan).astype(np.float32, copy=False)
+        for name, lookup in arrays.items()
+    }
 
 
 # ---------------------------------------------------------------------------
-# 5. Derived quantities -- soil texture class and carbon stock
+# 6. Derived quantities -- soil texture class and carbon stock
 # ---------------------------------------------------------------------------
 
+# USDA texture classes (simplified), in the order the rules below test them;
+# anything that matches no rule is "loam", and missing sand/clay is "unknown"
+TEXTURE_CLASSES = (
+    "sand",
+    "loamy sand",
+    "clay",
+    "silty clay",
+    "clay loam",
+    "silt",
+    "silt loam",
+    "sandy loam",
+    "loam",
+    "unknown",
+)
+
+
+def soil_texture_codes(sand, clay) -> np.ndarray:
+    """Classify soil texture for whole arrays using the USDA texture triangle.
+
+    The rules are evaluated as boolean masks and combined with np.select,
+    which keeps the first matching rule per element, so millions of pixels
+    are classified without a Python-level branch per value.
+
+    Args:
+        sand: Sand content in percent (0-100), scalar or array.
+        clay: Clay content in percent (0-100), same shape as ``sand``.
+
+    Returns:
+        int8 array of indices into TEXTURE_CLASSES; elements where sand or
+        clay is NaN (no HWSD2 record) get the "unknown" code.
+    """
+    sand = np.asarray(sand, dtype=np.float64)
+    clay = np.asarray(clay, dtype=np.float64)
+    silt = 100.0 - sand - clay
+    rules = [
+        (sand >= 85) & (clay < 10),
+        (sand >= 70) & (clay < 20),
+        (clay >= 40) & (silt < 40),
+        (clay >= 40) & (sand < 45),
+        (clay >= 27) & (sand >= 20) & (sand < 45),
+        silt >= 80,
+        (silt >= 50) & (clay >= 12) & (clay < 27),
+        (sand >= 52) & (clay < 20),
+    ]
+    codes = np.select(rules, np.arange(len(rules)), default=TEXTURE_CLASSES.index("loam"))
+    # NaN fails every comparison above, so it would otherwise fall to "loam"
+    codes[np.isnan(sand) | np.isnan(clay)] = TEXTURE_CLASSES.index("unknown")
+    return codes.astype(np.int8)
+
+
+def soil_texture_class_array(sand, clay) -> np.ndarray:
+    """Array version of soil_texture_class, returning class names."""
+    return np.asarray(TEXTURE_CLASSES)[soil_texture_codes(sand, clay)]
+
+
 def soil_texture_class(sand: float, clay: float) -> str:
     """Classify soil texture using the USDA texture triangle (simplified).
 
@@ -103,27 +365,7 @@ def soil_texture_class(sand: float, clay: float) -> str:
     Returns:
         USDA soil texture class name.
     """
-    silt = 100.0 - sand - clay
-    if sand >= 85 and clay < 10:
-        return "sand"
-    elif sand >= 70 and clay < 20:
-        return "loamy sand"
-    elif clay >= 40 and silt < 40:
-        return "clay"
-    elif clay >= 40 and sand < 45:
-        return "silty clay"
-    elif clay >= 27 and sand >= 20 and sand < 45:
-        return "clay loam"
-    elif silt >= 80:
-        return "silt"
-    elif silt >= 50 and clay >= 12 and clay < 27:
-        return "silt loam"
-    elif sand >= 52 and clay < 20:
-        return "sandy loam"
-    elif clay >= 20 and clay < 35 and silt >= 28 and sand < 52:
-        return "loam"
-    else:
-        return "loam"
+    return TEXTURE_CLASSES[int(soil_texture_codes(sand, clay))]
 
 
 def carbon_stock_tonnes_per_ha(
@@ -156,3 +398,187 @@ def carbon_stock_tonnes_per_ha(
         * (1 - gravel_fraction)
     )
     return stock
+
+
+def carbon_stock_array(
+    organic_carbon_g_per_kg: np.ndarray,
+    bulk_density_g_per_cm3: np.ndarray,
+    layer_thickness_cm: np.ndarray,
+    gravel_fraction: np.ndarray | float = 0.0,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Array version of carbon_stock_tonnes_per_ha.
+
+    Computes the same formula with in-place ufuncs into a single float32
+    buffer (``out`` if given), with the unit conversions folded into one
+    constant, so a raster of pixels is processed without a chain of
+    full-size temporaries.
+    """
+    out = np.multiply(
+        organic_carbon_g_per_kg, bulk_density_g_per_cm3, out=out, dtype=np.float32
+    )
+    out *= layer_thickness_cm
+    out *= 1.0 - np.asarray(gravel_fraction, dtype=np.float32)
+    # g/kg -> fraction (1/1000) * cm -> m (1/100) * m2 per ha (10,000)
+    out *= 0.1
+    return out
+
+
+def apply_soil_metrics(smu_codes: np.ndarray) -> dict[str, np.ndarray]:
+    """Decode raster SMU codes straight into texture class and carbon stock.
+
+    Gathers the needed attributes with lookup_smu_attributes, then runs the
+    vectorized texture classifier and carbon stock formula over the arrays,
+    so each pixel's SMU attributes are read once with no per-pixel Python.
+
+    Returns:
+        ``texture_code`` (int8 indices into TEXTURE_CLASSES) and
+        ``carbon_stock_t_per_ha`` (float32, topsoil layer), both shaped
+        like ``smu_codes``.
+    """
+    attrs = lookup_smu_attributes(smu_codes)
+    return {
+        "texture_code": soil_texture_codes(attrs["sand"], attrs["clay"]),
+        "carbon_stock_t_per_ha": carbon_stock_array(
+            attrs["organic_carbon"],
+            attrs["bulk_density"],
+            attrs["bottom_depth"] - attrs["top_depth"],
+            attrs["coarse_fragments"] / 100.0,
+        ),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 7. Windowed raster reads -- SMU codes for a set of H3 cells
+# ---------------------------------------------------------------------------
+
+_raster_local = threading.local()
+
+
+def _hwsd2_raster() -> rasterio.DatasetReader:
+    """The HWSD2 raster, opened once per thread.
+
+    rasterio datasets must not be shared between threads, but reopening the
+    remote file for every read repeats the header fetch.
+    """
+    import rasterio
+
+    if getattr(_raster_local, "dataset", None) is None:
+        with rasterio.Env(**HWSD2_GDAL_OPTIONS):
+            _raster_local.dataset = rasterio.open(METADATA['s3_raster_path'])
+    return _raster_local.dataset
+
+
+def read_smu_window(h3_cells: Sequence[str]) -> tuple[np.ndarray, Affine]:
+    """Read only the block of HWSD2 SMU codes under a set of H3 cells.
+
+    The cells' bounding box is widened to the raster's internal block grid,
+    so the read is one rectangular window made of whole tiles: each tile is
+    fetched once and no partial tile is requested twice. For a disk of a few
+    dozen cells this is a few hundred KB, not the global raster.
+
+    Returns:
+        The int32 SMU codes in the window and the window's affine transform,
+        ready for lookup_smu_attributes / apply_soil_metrics.
+    """
+    import rasterio
+    from rasterio.windows import Window, from_bounds
+
+    lats, lngs = np.array(
+        [point for cell in h3_cells for point in h3.cell_to_boundary(cell)]
+    ).T
+    dataset = _hwsd2_raster()
+    window = from_bounds(
+        lngs.min(), lats.min(), lngs.max(), lats.max(), transform=dataset.transform
+    )
+
+    # Snap outwards to whole blocks, clamped to the raster extent
+    block_rows, block_cols = dataset.block_shapes[0]
+    row_start = max(0, math.floor(window.row_off / block_rows) * block_rows)
+    col_start = max(0, math.floor(window.col_off / block_cols) * block_cols)
+    row_stop = min(
+        dataset.height,
+        math.ceil((window.row_off + window.height) / block_rows) * block_rows,
+    )
+    col_stop = min(
+        dataset.width,
+        math.ceil((window.col_off + window.width) / block_cols) * block_cols,
+    )
+    window = Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+
+    with rasterio.Env(**HWSD2_GDAL_OPTIONS):
+        codes = dataset.read(1, window=window, out_dtype=np.int32)
+    return codes, dataset.window_transform(window)
+
+
+# Uncomment to decode the pixels under the example cells directly:
+# smu_codes, smu_transform = read_smu_window(h3_cells)
+# metrics = apply_soil_metrics(smu_codes)
+# print(f"\nSMU window: {smu_codes.shape[0]} x {smu_codes.shape[1]} pixels")
+# print(f"  Mean topsoil carbon stock: {np.nanmean(metrics['carbon_stock_t_per_ha']):.1f} t/ha")
+
+
+# ---------------------------------------------------------------------------
+# 8. H3-partitioned Parquet shards -- repeated lookups without the raster
+# ---------------------------------------------------------------------------
+
+def _shard_path(parent: str) -> Path:
+    return HWSD2_SHARD_DIR / f"res{SHARD_H3_RESOLUTION}" / f"{parent}.parquet"
+
+
+def build_hwsd2_shard(parent: str) -> Path:
+    """Write per-cell soil attributes for every child of a coarse H3 cell.
+
+    Reads the HWSD2 window under ``parent`` once, samples the SMU code at
+    each SHARD_CELL_RESOLUTION child's centre (the children are about one
+    pixel in size), decodes the attributes and writes them to a Parquet
+    shard with a uint64 ``h3_cell`` column.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    children = sorted(h3.cell_to_children(parent, SHARD_CELL_RESOLUTION))
+    codes, transform = read_smu_window([parent])
+    lats, lngs = np.array([h3.cell_to_latlng(cell) for cell in children]).T
+    cols, rows = ~transform * (lngs, lats)
+    rows = np.clip(np.floor(rows).astype(np.intp), 0, codes.shape[0] - 1)
+    cols = np.clip(np.floor(cols).astype(np.intp), 0, codes.shape[1] - 1)
+    attrs = lookup_smu_attributes(codes[rows, cols])
+
+    table = pa.table({
+        "h3_cell": np.array([h3.str_to_int(cell) for cell in children], dtype=np.uint64),
+        **{name: attrs[name] for name in SHARD_COLUMNS},
+    })
+    path = _shard_path(parent)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_suffix(".parquet.partial")
+    pq.write_table(table, partial_path, compression="zstd")
+    partial_path.replace(path)
+    return path
+
+
+def lookup_from_shards(h3_cells: Sequence[str]) -> pd.DataFrame:
+    """Soil attributes for SHARD_CELL_RESOLUTION cells, read from shards.
+
+    Only the shards of the cells' parents are opened, and each is filtered
+    to the requested cells on read. Missing shards are built on first use,
+    so after a warm-up (or an offline pass over build_hwsd2_shard) a query
+    is a small Parquet read instead of a raster read and table join.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parents = {h3.cell_to_parent(cell, SHARD_H3_RESOLUTION) for cell in h3_cells}
+    wanted = [h3.str_to_int(cell) for cell in h3_cells]
+    tables = []
+    for parent in sorted(parents):
+        path = _shard_path(parent)
+        if not path.exists():
+            build_hwsd2_shard(parent)
+        tables.append(pq.read_table(path, filters=[("h3_cell", "in", wanted)]))
+    return pa.concat_tables(tables).to_pandas()
+
+
+# Uncomment to query the example cells through the shard cache:
+# shard_result = lookup_from_shards(h3_cells)
+# print(shard_result.to_string(index=False))
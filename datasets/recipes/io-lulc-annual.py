@@ -10,16 +10,88 @@ Classes: Water(1), Trees(2), Flooded_vegetation(4), Crops(5), Built_area(7),
          Bare_ground(8), Snow_ice(9), Clouds(10), Rangeland(11)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
 from hum_ai.data_engine.ancillary.landcover import (
     LandcoverAncillaryData,
     LandcoverCategory,
 )
 
+# Class name per class code, so a whole column is decoded with one gather
+# instead of an Enum lookup per row. Codes with no category map to "".
+_LC_NAMES = np.full(max(c.value for c in LandcoverCategory) + 1, "", dtype=object)
+for _category in LandcoverCategory:
+    _LC_NAMES[_category.value] = _category.name
+_LC_CODES = np.flatnonzero(_LC_NAMES != "")
+
 # ---------------------------------------------------------------------------
 # 1. Initialize the ancillary data handler
 # ---------------------------------------------------------------------------
 lc = LandcoverAncillaryData()
 
+
+def get_landcover_fractions_many(h3_cells, max_workers=32, **kwargs) -> pd.DataFrame:
+    """Land cover fractions for many cells, one row per cell.
+
+    Each get_landcover_fractions call is an independent COG range read that
+    spends most of its time waiting on HTTPS; GDAL releases the GIL while it
+    waits, so a thread pool overlaps the requests. Extra keyword arguments
+    are passed through to get_landcover_fractions.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        rows = list(pool.map(
+            lambda cell: lc.get_landcover_fractions(h3_cell=cell, **kwargs),
+            h3_cells,
+        ))
+
+    # Build one array per column and construct the frame once, rather than
+    # letting pandas align a list of per-cell rows
+    keys = dict.fromkeys(key for row in rows for key in row.keys())
+    columns = {
+        key: np.array([row.get(key, np.nan) for row in rows], dtype=np.float64)
+        for key in keys
+    }
+    return pd.DataFrame(columns, index=pd.Index(h3_cells, name="cell"), copy=False)
+
+
+def cells_to_uint64(cells) -> np.ndarray:
+    """Hex H3 cell IDs -> uint64 array (8 bytes each, integer hashing)."""
+    return np.fromiter((int(cell, 16) for cell in cells), dtype=np.uint64, count=len(cells))
+
+
+def cells_to_hex(cell_ids) -> list[str]:
+    """uint64 H3 cells -> hex string IDs, for display and Data Engine calls."""
+    return [format(cell, "x") for cell in np.asarray(cell_ids, dtype=np.uint64).tolist()]
+
+
+def class_fractions(pixels, nodata=0) -> dict[str, float]:
+    """Per-class fraction of valid pixels in a raw IO LULC array.
+
+    With only a dozen class codes, one np.bincount pass over the pixels
+    replaces any groupby/histogram machinery. Only pixels of a named
+    LandcoverCategory count towards the denominator, as in esa-worldcover's
+    compute_class_fractions: ``nodata``, NaN and any other code are
+    excluded, so the fractions sum to 1 whenever a valid pixel exists.
+    """
+    pixels = np.asarray(pixels).ravel()
+    if not np.issubdtype(pixels.dtype, np.integer):
+        pixels = pixels[~np.isnan(pixels)]
+    # np.bincount rejects negative values; codes past the table are unnamed
+    pixels = pixels[(pixels >= 0) & (pixels < len(_LC_NAMES))]
+    counts = np.bincount(pixels.astype(np.intp), minlength=len(_LC_NAMES))
+    if nodata is not None and 0 <= nodata < len(counts):
+        counts[int(nodata)] = 0
+    total = counts[_LC_CODES].sum()
+    return {
+        name: float(counts[code] / total) if total else 0.0
+        for code, name in enumerate(_LC_NAMES)
+        if name
+    }
+
+
 # ---------------------------------------------------------------------------
 # 2. Define your area of interest as H3 cells
 # ---------------------------------------------------------------------------
@@ -45,9 +117,7 @@ print(df.to_string(index=False))
 print()
 
 # Decode the majority class integer to a human-readable name
-df["majority_name"] = df["landcover_majority"].apply(
-    lambda v: LandcoverCategory(v).name
-)
+df["majority_name"] = _LC_NAMES[df["landcover_majority"].to_numpy().astype(np.intp)]
 print("=== With class names ===")
 print(df[["cell", "start_time", "majority_name", "landcover_unique"]].to_string(index=False))
 print()
@@ -67,6 +137,12 @@ print(f"CRS:   {data.rio.crs}")
 print(f"Nodata: {data.rio.nodata}")
 print()
 
+# Class fractions straight from the pixels (one bincount pass)
+print("=== Class fractions over all cells (2023) ===")
+for name, fraction in class_fractions(data.to_numpy(), data.rio.nodata).items():
+    print(f"  {name}: {fraction:.3f}")
+print()
+
 # ---------------------------------------------------------------------------
 # 5. Get per-class pixel fractions for a single cell (single year)
 # ---------------------------------------------------------------------------
@@ -79,10 +155,16 @@ print("=== Land cover fractions for single cell ===")
 for key, value in fractions.items():
     # Histogram columns are integer class codes; decode them
     try:
-        class_name = LandcoverCategory(int(key)).name
-        print(f"  {class_name}: {value}")
-    except (ValueError, KeyError):
-        print(f"  {key}: {value}")
+        class_name = _LC_NAMES[int(key)]
+    except (ValueError, IndexError):
+        class_name = ""
+    print(f"  {class_name or key}: {value}")
+print()
+
+# The same for every cell at once (reads run concurrently)
+fractions_df = get_landcover_fractions_many(h3_cells, histogram=True)
+print("=== Land cover fractions for all cells ===")
+print(fractions_df.to_string())
 print()
 
 # ---------------------------------------------------------------------------
@@ -93,16 +175,29 @@ df_all = lc.summarize_from_cells(
     h3_cells=h3_cells,
     date_range="2017-01-01/2023-12-31",
 )
+# Work with 64-bit cell indices from here on; hex strings only for display
+df_all["cell"] = cells_to_uint64(df_all["cell"])
 
+# Each (cell, year) should have one row, but a cell on a tile seam or a
+# repeated item can yield two; pivot would raise on those, so keep the first
 pivot = df_all.pivot_table(
     index="cell",
     columns="start_time",
     values="landcover_majority",
+    aggfunc="first",
 )
 
-changed_mask = pivot.nunique(axis=1) > 1
+# A cell changed if its largest and smallest class differ across the years
+# it has data for (missing years are NaN and ignored, as nunique does)
+vals = pivot.to_numpy(dtype=np.float32)
+valid = ~np.isnan(vals)
+changed_mask = (
+    np.where(valid, vals, -np.inf).max(axis=1)
+    > np.where(valid, vals, np.inf).min(axis=1)
+)
 if changed_mask.any():
     print("=== Cells with land cover change (2017-2023) ===")
-    print(pivot[changed_mask])
+    changed = pivot[changed_mask]
+    print(changed.set_axis(cells_to_hex(changed.index), axis="index"))
 else:
     print("No land cover changes detected across years for these cells.")
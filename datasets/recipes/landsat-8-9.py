@@ -23,8 +23,14 @@ Band order (0-based index in COLLECTION_BAND_MAP):
 
 from __future__ import annotations
 
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
 
 # ---------------------------------------------------------------------------
 # 1. Imports from the Data Engine
@@ -48,20 +54,73 @@ from hum_ai.data_engine.formats.olmo_earth_samples_v1.config import (
 )
 from hum_ai.data_engine.formats.olmo_earth_samples_v1.names import OlmoEarthModality
 
+# GDAL settings for reading the Landsat COGs on Azure Blob. Without them GDAL
+# lists the blob "directory" looking for sidecar files, sends a HEAD before
+# every GET and re-fetches tile headers for each band window it reads.
+GDAL_COG_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif",
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": "200000000",  # bytes, per opened file
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_VERSION": "2",
+}
+
+# Internal tile size of the Landsat C2 L2 COGs, in pixels
+COG_TILE_PX = 512
+
+# C2 L2 surface reflectance DN -> reflectance: DN * scale + offset, with DN 0
+# marking fill
+SR_SCALE = 2.75e-5
+SR_OFFSET = -0.2
+SR_FILL_DN = 0
+
+# QA_PIXEL bits that mark a pixel unusable: fill, dilated cloud, cirrus,
+# cloud and cloud shadow
+QA_PIXEL_MASK_BITS = (0, 1, 2, 3, 4)
+
+
+def gdal_cog_env():
+    """A ``rasterio.Env`` applying GDAL_COG_OPTIONS for the ``with`` block.
+
+    Scoped rather than written to ``os.environ``, so importing this recipe
+    leaves GDAL's configuration in the rest of the process untouched. Wrap
+    both the opens and the computes of lazy reads in it, e.g.
+    ``with gdal_cog_env(): load_masked_bands(...).compute()``.
+    """
+    import rasterio
+
+    return rasterio.Env(**GDAL_COG_OPTIONS)
+
+
 # ---------------------------------------------------------------------------
 # 2. Inspect Landsat source metadata
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def _landsat_info() -> MappingProxyType:
+    """Read-only snapshot of SOURCE_INFO for Landsat, looked up once."""
+    return MappingProxyType(dict(SOURCE_INFO[CollectionName.LANDSAT]))
+
+
+@functools.cache
+def _landsat_band_index() -> MappingProxyType:
+    """Band ID -> position in the default band order."""
+    return MappingProxyType(
+        {band_id: i for i, band_id in enumerate(_landsat_info()["band_ids"])}
+    )
+
+
 def inspect_landsat_metadata() -> None:
     """Print the Data Engine's stored metadata for Landsat 8/9.
 
     SOURCE_INFO contains band IDs, band names, resolution, and requester-pays
     information for each collection.
     """
-    landsat_info = SOURCE_INFO[CollectionName.LANDSAT]
     print("Landsat SOURCE_INFO:")
-    for key, value in landsat_info.items():
+    for key, value in _landsat_info().items():
         print(f"  {key}: {value}")
     # Expected output:
     #   band_ids: ['blue', 'green', 'red', 'nir08', 'swir16', 'swir22']
@@ -111,8 +170,8 @@ def create_landsat_collection_input() -> CollectionInput:
     # This is equivalent to the explicit version:
     landsat_input_explicit = CollectionInput(
         collection_name=CollectionName.LANDSAT,
-        band_ids=('blue', 'green', 'red', 'nir08', 'swir16', 'swir22'),
-        resolution=30.0,
+        band_ids=tuple(_landsat_info()["band_ids"]),  # blue ... swir22
+        resolution=_landsat_info()["resolution"],  # 30.0
         # No default catalog_filters for Landsat (unlike Sentinel-2).
         # Cloud masking is typically done in post-processing via QA_PIXEL.
         catalog_filters=None,
@@ -152,6 +211,33 @@ landsat_with_thermal = CollectionInput(
 # ---------------------------------------------------------------------------
 
 
+def suggest_aligned_chip_size(
+    resolution_m: float,
+    target_m: float,
+    cog_tile_px: int = COG_TILE_PX,
+) -> float:
+    """Return the chip size nearest ``target_m`` that tiles evenly with the COG.
+
+    A chip whose pixel size divides the COG's internal tile size (or is a
+    whole number of tiles) never straddles more tiles than it has to once its
+    origin sits on the tile grid. Any other size makes neighbouring chips
+    share partially-read tiles, so the same bytes are range-requested twice.
+
+    Args:
+        resolution_m: Output pixel size in metres.
+        target_m: Desired chip size in metres.
+        cog_tile_px: Internal tile size of the source COGs, in pixels.
+
+    Returns:
+        The aligned chip size in metres.
+    """
+    divisors = [px for px in range(1, cog_tile_px + 1) if cog_tile_px % px == 0]
+    multiples = [cog_tile_px * k for k in range(2, 9)]
+    target_px = target_m / resolution_m
+    best_px = min(divisors + multiples, key=lambda px: abs(px - target_px))
+    return best_px * resolution_m
+
+
 def create_image_chips_v3_config() -> ImageChipsV3Configuration:
     """Create an ImageChipsV3Configuration for Landsat surface reflectance chips.
 
@@ -163,6 +249,12 @@ def create_image_chips_v3_config() -> ImageChipsV3Configuration:
         - chip_size_m=3840  -> 128x128 pixels
         - chip_size_m=7680  -> 256x256 pixels
 
+    All three divide the 512x512 internal tiles of the source COGs, so a chip
+    aligned to the tile grid reads only tiles it overlaps. Sizes such as
+    100 px do not, and adjacent chips then re-fetch the same partial tiles;
+    suggest_aligned_chip_size() snaps an arbitrary size to the nearest one
+    that tiles evenly.
+
     Returns:
         An ImageChipsV3Configuration for producing Landsat chips.
     """
@@ -178,7 +270,7 @@ def create_image_chips_v3_config() -> ImageChipsV3Configuration:
             band_ids=('blue', 'green', 'red', 'nir08', 'swir16', 'swir22'),
             resolution=30.0,
         ),
-        chip_size_m=3840.0,  # 128x128 pixels at 30m
+        chip_size_m=suggest_aligned_chip_size(30.0, 3840.0),  # 128x128 px
     )
     print(f"Chip size: {config.chip_size_pixels} x {config.chip_size_pixels} pixels")
     print(f"Bands: {config.chip_collection_input.band_ids}")
@@ -359,11 +451,245 @@ def ndbi(swir16, nir):
     return (swir16 - nir) / (swir16 + nir)
 
 
+# Output order of compute_all_indices
+INDEX_NAMES = ("ndvi", "nbr", "ndmi", "ndwi", "ndbi")
+
+# int8 encoding of [-1, 1] indices: value * 127, with -128 reserved for NaN.
+# Store the scale alongside quantized data so readers can decode it.
+INDEX_INT8_SCALE = 127
+INDEX_INT8_NODATA = -128
+
+
+def quantize_indices(indices) -> np.ndarray:
+    """Encode float indices in [-1, 1] as int8 (1/127 precision).
+
+    Values outside [-1, 1] are clipped; NaN becomes INDEX_INT8_NODATA.
+    """
+    scaled = np.rint(np.asarray(indices, dtype=np.float32) * INDEX_INT8_SCALE)
+    np.clip(scaled, -INDEX_INT8_SCALE, INDEX_INT8_SCALE, out=scaled)
+    scaled[np.isnan(scaled)] = INDEX_INT8_NODATA
+    return scaled.astype(np.int8)
+
+
+def dequantize_indices(quantized) -> np.ndarray:
+    """Decode quantize_indices() output back to float32, restoring NaN."""
+    quantized = np.asarray(quantized)
+    indices = quantized.astype(np.float32) / INDEX_INT8_SCALE
+    indices[quantized == INDEX_INT8_NODATA] = np.nan
+    return indices
+
+
+def compute_all_indices(
+    chip,
+    out=None,
+    indices_dtype: str = "float32",
+    reflectance: bool = False,
+) -> np.ndarray:
+    """Compute all five indices above from one (H, W, 6) band stack.
+
+    The stack is converted to float32 once, applying the C2 L2 scale and
+    offset on the way (normalized differences of raw DNs are biased by the
+    -0.2 offset, and uint16 subtraction wraps around), and every index is
+    written straight into its slice of the output with two scratch buffers
+    reused across indices. NDBI is the negation of NDMI, so it is not
+    recomputed.
+
+    Args:
+        chip: Array of shape (H, W, 6) in the default band order blue,
+            green, red, nir08, swir16, swir22.
+        out: Optional float32 array of shape (H, W, 5) to fill.
+        indices_dtype: "float32", or "int8" to return quantize_indices()
+            output -- a quarter of the bytes for storage and transport.
+            Raw reflectance bands are unaffected.
+        reflectance: True if ``chip`` already holds scaled reflectance
+            rather than C2 L2 DNs, so no scale/offset is applied.
+
+    Returns:
+        Array of shape (H, W, 5) in INDEX_NAMES order. Pixels where either
+        band is fill, or both are zero reflectance, are NaN
+        (INDEX_INT8_NODATA when quantized).
+    """
+    # Always a copy, so the in-place scaling never touches the caller's array
+    stack = np.array(chip, dtype=np.float32)
+    if not reflectance:
+        fill = stack == SR_FILL_DN
+        stack *= SR_SCALE
+        stack += SR_OFFSET
+        stack[fill] = np.nan
+    band = _landsat_band_index()
+    green, red, nir, swir16, swir22 = (
+        stack[..., band[name]] for name in ("green", "red", "nir08", "swir16", "swir22")
+    )
+    if out is None:
+        out = np.empty(stack.shape[:-1] + (len(INDEX_NAMES),), dtype=np.float32)
+
+    numerator = np.empty(stack.shape[:-1], dtype=np.float32)
+    denominator = np.empty_like(numerator)
+    pairs = ((nir, red), (nir, swir22), (nir, swir16), (green, nir))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k, (a, b) in enumerate(pairs):
+            np.subtract(a, b, out=numerator)
+            np.add(a, b, out=denominator)
+            np.divide(numerator, denominator, out=out[..., k])
+    np.negative(out[..., 2], out=out[..., 4])
+    if indices_dtype == "int8":
+        return quantize_indices(out)
+    return out
+
+
 # ---------------------------------------------------------------------------
 # 10. Direct STAC access (outside Data Engine framework)
 # ---------------------------------------------------------------------------
 
 
+def _date_windows(start: datetime, end: datetime, n_windows: int) -> list[tuple]:
+    """Split [start, end] into ``n_windows`` consecutive, equal date windows."""
+    step = (end - start) / n_windows
+    bounds = [start + i * step for i in range(n_windows)] + [end]
+    # The last bound is ``end`` itself: n_windows * step can round to just
+    # short of it, which would drop items at the very end of the range
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def search_items_concurrently(
+    catalog,
+    collection: str,
+    bbox: list[float],
+    start: datetime,
+    end: datetime,
+    n_windows: int = 8,
+) -> list:
+    """Search a date range as independent per-window searches run in parallel.
+
+    STAC API pagination follows token-based 'next' links, so the pages of a
+    single search can only be fetched one after another. Splitting the date
+    range into ``n_windows`` disjoint windows gives independent searches
+    whose page chains run concurrently, turning a latency-bound serial walk
+    into roughly one window's worth of round trips.
+
+    Returns:
+        The matched items, in window order, without duplicates (datetime
+        ranges are inclusive, so an item exactly on a window edge would
+        otherwise be returned twice).
+    """
+    windows = _date_windows(start, end, n_windows)
+
+    def search_window(window):
+        return list(catalog.search(
+            collections=[collection],
+            bbox=bbox,
+            datetime=window,
+        ).items())
+
+    with ThreadPoolExecutor(max_workers=n_windows) as pool:
+        results = pool.map(search_window, windows)
+
+    items = {}
+    for window_items in results:
+        for item in window_items:
+            items.setdefault(item.id, item)
+    return list(items.values())
+
+
+def search_items_table(
+    catalog,
+    collection: str,
+    bbox: list[float],
+    start: datetime,
+    end: datetime,
+    n_windows: int = 8,
+):
+    """Like search_items_concurrently, but without building pystac Items.
+
+    Result pages are consumed as plain dicts and collected into an Arrow
+    table with columns ``id``, ``datetime`` (parsed for the whole column at
+    once), ``bbox`` and ``feature`` (the item's JSON). Constructing a pystac
+    Item per result -- nested asset objects, per-item datetime parsing --
+    costs more than the search itself for thousands of scenes; use
+    item_from_row() to hydrate only the rows you actually need.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    def search_window(window):
+        search = catalog.search(collections=[collection], bbox=bbox, datetime=window)
+        return [feature for page in search.pages_as_dicts() for feature in page["features"]]
+
+    windows = _date_windows(start, end, n_windows)
+    with ThreadPoolExecutor(max_workers=n_windows) as pool:
+        results = pool.map(search_window, windows)
+
+    features = {}
+    for window_features in results:
+        for feature in window_features:
+            features.setdefault(feature["id"], feature)
+    features = list(features.values())
+
+    datetimes = pd.to_datetime(
+        [feature["properties"]["datetime"] for feature in features],
+        utc=True,
+        format="ISO8601",
+    )
+    return pa.table({
+        "id": [feature["id"] for feature in features],
+        "datetime": pa.array(pd.Series(datetimes)),
+        "bbox": [feature.get("bbox") for feature in features],
+        "feature": [json.dumps(feature) for feature in features],
+    })
+
+
+def item_from_row(table, index: int):
+    """Hydrate one row of a search_items_table() result into a pystac Item."""
+    import pystac
+
+    return pystac.Item.from_dict(json.loads(table["feature"][index].as_py()))
+
+
+def qa_cloud_mask(qa_pixel):
+    """Return True where QA_PIXEL flags fill, cloud, cirrus or cloud shadow.
+
+    Works unchanged on numpy, xarray and dask-backed arrays.
+    """
+    bitmask = sum(1 << bit for bit in QA_PIXEL_MASK_BITS)
+    return (qa_pixel & bitmask) != 0
+
+
+def load_masked_bands(item, bands: list[str], bbox: list[float]):
+    """Open Landsat bands lazily, clipped to ``bbox`` and cloud-masked.
+
+    Each band is opened as a dask-backed array chunked on the COG tile grid
+    and clipped before anything is read, so only tiles inside ``bbox`` are
+    ever fetched. The QA_PIXEL mask is applied with ``.where`` on the lazy
+    arrays; nothing is downloaded or decoded until the caller computes the
+    result (e.g. when a chip is serialized). The opens run under
+    gdal_cog_env(); compute inside it as well so the tile reads get the
+    same settings.
+
+    Args:
+        item: A signed Landsat C2 L2 STAC item.
+        bands: Asset keys to load, e.g. ["red", "nir08"].
+        bbox: (west, south, east, north) in EPSG:4326.
+
+    Returns:
+        A lazy DataArray with dims (band, y, x); masked pixels are NaN.
+    """
+    import rioxarray
+    import xarray as xr
+
+    def open_band(asset_key):
+        return rioxarray.open_rasterio(
+            item.assets[asset_key].href,
+            chunks={"x": COG_TILE_PX, "y": COG_TILE_PX},
+            lock=False,
+        ).squeeze("band", drop=True).rio.clip_box(*bbox, crs="EPSG:4326")
+
+    with gdal_cog_env():
+        qa = open_band("qa_pixel")
+        stack = xr.concat([open_band(band) for band in bands], dim="band")
+    stack = stack.assign_coords(band=list(bands))
+    return stack.where(~qa_cloud_mask(qa))
+
+
 def direct_stac_access_example() -> None:
     """Show how to query Landsat C2 L2 directly from the Planetary Computer
     STAC API using pystac-client.
@@ -379,22 +705,30 @@ def direct_stac_access_example() -> None:
         modifier=planetary_computer.sign_inplace,
     )
 
-    # Search for Landsat C2 L2 items over San Francisco Bay Area
-    search = catalog.search(
-        collections=["landsat-c2-l2"],
+    # Search for Landsat C2 L2 items over San Francisco Bay Area. Five months
+    # span several result pages, so search monthly windows in parallel.
+    # Results stay as an Arrow table; only the item we inspect becomes a
+    # pystac Item.
+    items = search_items_table(
+        catalog,
+        collection="landsat-c2-l2",
         bbox=[-122.5, 37.5, -122.0, 38.0],
-        datetime="2023-01-01/2023-06-01",
+        start=datetime(2023, 1, 1, tzinfo=UTC),
+        end=datetime(2023, 6, 1, tzinfo=UTC),
+        n_windows=5,
     )
+    print(f"Found {items.num_rows} Landsat C2 L2 items")
 
-    items = list(search.items())
-    print(f"Found {len(items)} Landsat C2 L2 items")
-
-    if items:
-        sample = items[0]
+    if items.num_rows:
+        sample = item_from_row(items, 0)
         print(f"  ID: {sample.id}")
         print(f"  Date: {sample.datetime}")
         print(f"  Assets: {list(sample.assets.keys())}")
 
+        # Lazy, cloud-masked load -- only COG headers are read here
+        masked = load_masked_bands(sample, ["red", "nir08"], [-122.5, 37.5, -122.0, 38.0])
+        print(f"  Masked red/nir08 stack: {dict(masked.sizes)} (not yet computed)")
+
 
 # ---------------------------------------------------------------------------
 # Main
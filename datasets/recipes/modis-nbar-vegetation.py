@@ -17,6 +17,12 @@ Output columns: cell, start_time, end_time, ndvi_min, ndvi_p10, ndvi_p50,
                 ndvi_p90, ndvi_max
 """
 
+import calendar
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
 from hum_ai.data_engine.ancillary.indices import IndicesAncillaryData, METADATA
 from hum_ai.data_engine.config import get_config
 from hum_ai.data_engine.database.utils import upsert_ancillary_data
@@ -80,8 +86,30 @@ for ts in timestamps:
 #      e. Runs zonal statistics (min, p10, p50, p90, max) per H3 cell
 #      f. Averages across time slices within the month
 #   4. Concatenates results across all months
+#
+# The months are independent and each one is dominated by HTTP and GDAL
+# waits, so instead of one call that walks them serially, run one call per
+# month on a thread pool and concatenate the results in month order.
+
+
+def summarize_months_concurrently(h3_cells, months, max_workers=8) -> pd.DataFrame:
+    """Run summarize_from_cells for each month concurrently and concatenate.
+
+    Each month gets its own IndicesAncillaryData instance, since nothing
+    documents that one instance may be used from several threads at once.
+    """
+    if not months:
+        return pd.DataFrame(columns=METADATA["output_columns"])
+
+    def summarize_month(month):
+        return IndicesAncillaryData().summarize_from_cells(h3_cells, [month])
 
-df = indices.summarize_from_cells(h3_cells, timestamps)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(months))) as pool:
+        frames = list(pool.map(summarize_month, months))
+    return pd.concat(frames, ignore_index=True)
+
+
+df = summarize_months_concurrently(h3_cells, timestamps)
 
 print(f"\nResults shape: {df.shape}")
 print(f"Columns: {list(df.columns)}")
@@ -134,23 +162,58 @@ The spread between p10 and p90 indicates within-month variability:
 
 # For direct STAC access without the ancillary pipeline:
 
-# import pystac_client
-# import planetary_computer
+PLANETARY_COMPUTER_STAC_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
+
+
+@functools.lru_cache(maxsize=1)
+def get_catalog():
+    """The Planetary Computer STAC client, opened once and shared by every search."""
+    import planetary_computer
+    import pystac_client
+
+    return pystac_client.Client.open(
+        PLANETARY_COMPUTER_STAC_URL,
+        modifier=planetary_computer.sign_inplace,
+    )
+
+
+def search_items_by_month(bbox: list[float], months: list[str]) -> dict[str, list]:
+    """Find MODIS items for several months with a single STAC search.
+
+    One search spans the first through last month and its items are bucketed
+    by the month of their datetime, instead of one search round-trip per
+    month. Items falling in months that were not asked for (gaps between
+    non-consecutive months) are dropped.
+
+    Args:
+        bbox: (west, south, east, north) in EPSG:4326.
+        months: Month IDs like ``['2020-07', '2020-08']``.
+
+    Returns:
+        Dictionary mapping each requested month to its list of items.
+    """
+    first, last = min(months), max(months)
+    year, month = map(int, last.split("-"))
+    last_day = calendar.monthrange(year, month)[1]
+
+    search = get_catalog().search(
+        collections=["modis-43A4-061"],
+        bbox=bbox,
+        datetime=f"{first}-01/{last}-{last_day:02d}",
+    )
+    buckets = {m: [] for m in months}
+    for item in search.items():
+        key = item.datetime.strftime("%Y-%m")
+        if key in buckets:
+            buckets[key].append(item)
+    return buckets
+
+
 # import odc.stac
 #
-# catalog = pystac_client.Client.open(
-#     'https://planetarycomputer.microsoft.com/api/stac/v1',
-#     modifier=planetary_computer.sign_inplace,
-# )
-#
-# search = catalog.search(
-#     collections=['modis-43A4-061'],
-#     bbox=[-122.5, 37.5, -122.0, 38.0],
-#     datetime='2020-07-01/2020-07-31',
-# )
-#
-# items = search.item_collection()
-# print(f"Found {len(items)} MODIS items")
+# items_by_month = search_items_by_month([-122.5, 37.5, -122.0, 38.0], timestamps)
+# items = items_by_month['2020-07']
+# print(f"Found {len(items)} MODIS items for 2020-07")
 #
 # # Load as xarray (Dask-backed)
 # data = odc.stac.load(
@@ -164,3 +227,10 @@ The spread between p10 and p90 indicates within-month variability:
 # nir = data['Nadir_Reflectance_Band2']
 # denom = nir + red
 # ndvi = (nir - red).where(denom != 0) / denom.where(denom != 0)
+#
+# # NDVI lies in [-1, 1], so before a percentile reduction it can be stored
+# # as int8 (x * 127, -128 for nodata): a quarter of the float32 memory, and
+# # since the scaling is monotonic, percentiles of the codes (excluding -128)
+# # are the percentiles of NDVI to within 1/127. Decode the reduced values
+# # once at the end with q.astype('float32') / 127.
+# ndvi_i8 = (ndvi * 127).round().clip(-127, 127).fillna(-128).astype('int8')
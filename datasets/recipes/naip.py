@@ -24,6 +24,8 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 
+import numpy as np
+
 # ---------------------------------------------------------------------------
 # 1. Imports from the Data Engine
 # ---------------------------------------------------------------------------
@@ -243,6 +245,26 @@ def create_multi_source_project_definition(
 # ---------------------------------------------------------------------------
 
 
+def _normalized_difference(a, b):
+    """(a - b) / (a + b), in float32, with one temporary beyond the result.
+
+    NAIP bands are uint8, so the inputs are cast before subtracting (uint8
+    subtraction wraps around). The cast of ``b`` becomes the sum in place,
+    and the cast of ``a`` becomes the difference and then the quotient, so
+    only those two arrays are ever allocated. Works on numpy and xarray
+    inputs alike; pixels where a + b == 0 are NaN.
+    """
+    result = a.astype(np.float32)
+    total = b.astype(np.float32)
+    total += result
+    # 2a - (a + b) == a - b, exact in float32 for 8-bit (even 16-bit) inputs
+    result *= 2
+    result -= total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result /= total
+    return result
+
+
 def ndvi(red, nir):
     """Normalized Difference Vegetation Index: (NIR - Red) / (NIR + Red)
 
@@ -250,7 +272,7 @@ def ndvi(red, nir):
     At 2.5m resolution, NDVI captures fine-scale vegetation patterns
     such as individual tree crowns and field-level crop variability.
     """
-    return (nir - red) / (nir + red)
+    return _normalized_difference(nir, red)
 
 
 def ndwi(green, nir):
@@ -259,7 +281,7 @@ def ndwi(green, nir):
     NAIP band mapping: Green = band 1, NIR = band 3.
     Useful for delineating water bodies and wetland boundaries.
     """
-    return (green - nir) / (green + nir)
+    return _normalized_difference(green, nir)
 
 
 # ---------------------------------------------------------------------------
@@ -12,22 +12,27 @@ Usage:
     python nasadem.py
 
 Requirements:
-    pip install pystac-client planetary-computer odc-stac h3 rioxarray rasterstats shapely
+    pip install pystac-client planetary-computer odc-stac h3 rioxarray rasterio shapely pyarrow
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
 from collections.abc import Iterable
 
 import h3
+import numpy as np
 import odc.stac
 import pandas as pd
 import planetary_computer
+import pyarrow as pa
+import pystac
 import pystac_client
-from rasterstats import zonal_stats
-from shapely.geometry import Polygon
-from shapely.ops import unary_union
+import shapely
+from shapely.geometry import Polygon, box
+from shapely.strtree import STRtree
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -40,22 +45,69 @@ STAC_CATALOG_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
 STAC_COLLECTION = "nasadem"
 DEFAULT_H3_RESOLUTION = 11  # ~2000 m2 cells, ~24.8m spacing
 OUTPUT_COLUMNS = ["cell", "elevation_median", "elevation_range"]
+OUTPUT_SCHEMA = pa.schema([
+    ("cell", pa.string()),
+    ("elevation_median", pa.float32()),
+    ("elevation_range", pa.float32()),
+])
 NODATA_VALUE = -999
 
+# Dask chunk edge in pixels: two of the COGs' 512x512 internal tiles, so every
+# chunk covers whole tiles and each range request fetches useful bytes
+LOAD_CHUNK_SIZE = 1024
+
+# Rasters up to this many pixels are summarized from one in-memory array;
+# larger ones are reduced chunk by chunk so the full raster never materializes
+GLOBAL_EXTENT_MAX_PIXELS = 4096 * 4096
+
+# NASADEM's 1 arc-second posting, used to size a load from its bbox
+PIXEL_SIZE_DEG = 1 / 3600
+
+# Below this fraction of a raster (block) covered by cells, a full-size label
+# raster is mostly empty; mask each cell over its own window instead
+SPARSE_COVERAGE_FRACTION = 0.1
+
+# Load bboxes are snapped outward to this grid (degrees) so that successive
+# cell batches over the same area share one cached load
+LOAD_CACHE_GRID_DEG = 0.05
+LOAD_CACHE_SIZE = 16
+
 
 # ---------------------------------------------------------------------------
-# Helper: convert H3 cells to a unified polygon (from h3_utils.py)
+# Helpers: convert H3 cells to Shapely polygons (from h3_utils.py)
 # ---------------------------------------------------------------------------
 
 
+def h3_cells_to_polygons(h3_cells: Iterable[str]) -> np.ndarray:
+    """Convert H3 cell IDs to an array of Shapely polygons, one per cell.
+
+    This is the pipeline's only per-cell call into H3: h3-py has no batched
+    boundary lookup (cells_to_h3shape returns the union, not per-cell
+    rings), so build the array once and pass it to everything that needs
+    cell geometry, as summarize_elevation does.
+    """
+    boundaries = [h3.cell_to_boundary(cell) for cell in h3_cells]
+    if not boundaries:
+        return np.empty(0, dtype=object)
+
+    # Most cells have 6 vertices, but pentagons and cells crossing icosahedron
+    # edges do not, so build the rings from one flat coordinate array plus a
+    # per-vertex ring index. h3.cell_to_boundary returns (lat, lng) pairs;
+    # Shapely wants (lng, lat).
+    coords = np.concatenate(boundaries)[:, ::-1]
+    ring_index = np.repeat(np.arange(len(boundaries)), [len(b) for b in boundaries])
+    return shapely.polygons(shapely.linearrings(coords, indices=ring_index))
+
+
 def h3_cells_to_polygon(h3_cells: Iterable[str]) -> Polygon:
-    """Convert a collection of H3 cell IDs to a single Shapely polygon."""
-    polygons = []
-    for cell in h3_cells:
-        # h3.cell_to_boundary returns (lat, lng) pairs; Shapely wants (lng, lat)
-        lonlats = [(lng, lat) for (lat, lng) in h3.cell_to_boundary(cell)]
-        polygons.append(Polygon(lonlats))
-    return unary_union(polygons)
+    """Convert a collection of H3 cell IDs to a single Shapely polygon.
+
+    Only for callers that need the merged footprint itself; for a bounding
+    box, use ``shapely.total_bounds(h3_cells_to_polygons(...))`` instead.
+    """
+    # H3 cells tile the sphere without overlapping, so they form a valid
+    # polygonal coverage and can use GEOS's much cheaper coverage union
+    return shapely.coverage_union_all(h3_cells_to_polygons(h3_cells))
 
 
 # ---------------------------------------------------------------------------
@@ -63,6 +115,24 @@ def h3_cells_to_polygon(h3_cells: Iterable[str]) -> Polygon:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def get_catalog() -> pystac_client.Client:
+    """Open the Planetary Computer STAC client once and reuse it."""
+    return pystac_client.Client.open(STAC_CATALOG_URL)
+
+
+def _sign_item(item: pystac.Item) -> pystac.Item:
+    """
+    Sign ``item``'s asset hrefs in place. planetary_computer keeps one SAS
+    token per storage container and renews it shortly before it expires, so
+    after the first item this is a local string operation, and hrefs are
+    never signed with a token that is about to lapse.
+    """
+    for asset in item.assets.values():
+        asset.href = planetary_computer.sign(asset.href)
+    return item
+
+
 def search_nasadem_tiles(bbox: tuple[float, float, float, float]):
     """
     Search the Planetary Computer STAC catalog for NASADEM tiles
@@ -78,18 +148,20 @@ def search_nasadem_tiles(bbox: tuple[float, float, float, float]):
     pystac.ItemCollection
         Matched STAC items
     """
-    catalog = pystac_client.Client.open(
-        STAC_CATALOG_URL,
-        modifier=planetary_computer.sign_inplace,
+    items = pystac.ItemCollection(
+        _sign_item(item) for item in _search_nasadem_unsigned(bbox)
     )
+    logger.info("STAC search returned %d NASADEM items", len(items))
+    return items
+
 
-    search = catalog.search(
+def _search_nasadem_unsigned(bbox: tuple[float, float, float, float]) -> list[pystac.Item]:
+    """Unsigned STAC items for ``bbox``; see search_nasadem_tiles."""
+    search = get_catalog().search(
         collections=[STAC_COLLECTION],
         bbox=bbox,
     )
-    items = search.item_collection()
-    logger.info("STAC search returned %d NASADEM items", len(items))
-    return items
+    return list(search.items())
 
 
 # ---------------------------------------------------------------------------
@@ -113,16 +185,28 @@ def load_nasadem_raster(items, bbox: tuple[float, float, float, float]):
     xarray.DataArray
         Elevation values with nodata set to -999
     """
+    # Skip sidecar-file probing and use GDAL's COG-friendly HTTP settings
+    odc.stac.configure_rio(cloud_defaults=True)
     data = odc.stac.load(
         items,
-        chunks={"x": 128, "y": 128},
+        chunks={"x": LOAD_CHUNK_SIZE, "y": LOAD_CHUNK_SIZE},
         bbox=bbox,
+        bands=["elevation"],  # NASADEM's single band
+        # Keep the stored int16 elevations; the zonal sort runs on 2-byte
+        # values and only the per-cell results are converted to float
+        dtype="int16",
+        # Declared here so it is part of the load itself (pixels outside
+        # every tile are filled with it) rather than patched onto the
+        # DataArray afterwards with rio.write_nodata
+        nodata=NODATA_VALUE,
     )
 
-    # NASADEM comes back with an extra singleton 'variable' dimension
-    # after .to_array() -- squeeze it out
-    data = data.to_array().squeeze(dim="variable")
-    data.rio.write_nodata(NODATA_VALUE, inplace=True)
+    # Select the band directly (no .to_array() concatenation in the dask
+    # graph) and drop the static product's single time step, leaving a
+    # 2-D (y, x) raster
+    data = data["elevation"]
+    if "time" in data.dims:
+        data = data.squeeze("time", drop=True)
 
     logger.info(
         "Loaded raster: shape=%s, CRS=%s", data.shape, data.rio.crs
@@ -130,21 +214,280 @@ def load_nasadem_raster(items, bbox: tuple[float, float, float, float]):
     return data
 
 
+def _snap_bbox(bbox: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    """Expand a bbox outward to the LOAD_CACHE_GRID_DEG grid."""
+    west, south, east, north = bbox
+    step = LOAD_CACHE_GRID_DEG
+    return (
+        round(float(np.floor(west / step)) * step, 6),
+        round(float(np.floor(south / step)) * step, 6),
+        round(float(np.ceil(east / step)) * step, 6),
+        round(float(np.ceil(north / step)) * step, 6),
+    )
+
+
+@functools.lru_cache(maxsize=LOAD_CACHE_SIZE)
+def _search_nasadem_cached(bbox: tuple[float, float, float, float]) -> tuple[pystac.Item, ...]:
+    """STAC search for a snapped bbox, cached unsigned so no SAS token is kept."""
+    return tuple(_search_nasadem_unsigned(bbox))
+
+
+def _load_nasadem_signed(bbox: tuple[float, float, float, float]):
+    """Lazy load of the cached search results, signed afresh for this call."""
+    items = _search_nasadem_cached(bbox)
+    if not items:
+        return None
+    # Sign copies, so the cached items stay unsigned
+    signed = pystac.ItemCollection(_sign_item(item.clone()) for item in items)
+    return load_nasadem_raster(signed, bbox)
+
+
+@functools.lru_cache(maxsize=LOAD_CACHE_SIZE)
+def _load_nasadem_persisted(bbox: tuple[float, float, float, float]):
+    """A small load, read once and kept in memory by ``.persist()``."""
+    data = _load_nasadem_signed(bbox)
+    return None if data is None else data.persist()
+
+
+def load_nasadem_cached(bbox: tuple[float, float, float, float]):
+    """
+    Search and load NASADEM for a snapped bbox, reusing earlier work.
+
+    The STAC search is cached for every bbox, as unsigned items, so later
+    cell batches over the same area skip it. Loads of at most
+    GLOBAL_EXTENT_MAX_PIXELS are also ``.persist()``-ed and cached, so their
+    COG reads happen once and at most 32 MiB of int16 pixels is held per
+    entry; once in memory they need no SAS token. Larger loads are rebuilt
+    lazily on every call with freshly signed hrefs, so a long-running
+    pipeline never reads through an expired token and the cache never pins
+    full regional rasters.
+
+    The caches are per process. Multi-process pipelines should instead write
+    the load to a shared Zarr store once (``data.to_zarr(path)``) and reopen
+    it lazily in each worker, as ``cop-dem.py`` does with ``cache_dir``.
+
+    Parameters
+    ----------
+    bbox : tuple
+        (west, south, east, north), already snapped with ``_snap_bbox``
+
+    Returns
+    -------
+    xarray.DataArray or None
+        The elevation raster, or None if no tiles cover the bbox
+    """
+    west, south, east, north = bbox
+    pixels = ((east - west) / PIXEL_SIZE_DEG) * ((north - south) / PIXEL_SIZE_DEG)
+    if pixels <= GLOBAL_EXTENT_MAX_PIXELS:
+        return _load_nasadem_persisted(bbox)
+    return _load_nasadem_signed(bbox)
+
+
 # ---------------------------------------------------------------------------
 # Step 3: Compute zonal statistics per H3 cell
 # ---------------------------------------------------------------------------
 
 
+def _polygon_window(poly: Polygon, transform, shape: tuple[int, int]):
+    """
+    Pixel window of ``poly``'s bounding box within a raster of ``shape``, or
+    None if the polygon falls entirely outside it. Kept identical to
+    ``_polygon_window`` in cop-dem.py.
+    """
+    from rasterio.windows import Window, from_bounds
+
+    # Round each end outward separately: flooring the offset and then
+    # ceiling only the fractional length can stop one pixel short of the
+    # bbox's far edge and drop that row/column of the cell
+    window = from_bounds(*poly.bounds, transform=transform)
+    row_start = max(math.floor(window.row_off), 0)
+    col_start = max(math.floor(window.col_off), 0)
+    row_stop = min(math.ceil(window.row_off + window.height), shape[0])
+    col_stop = min(math.ceil(window.col_off + window.width), shape[1])
+    if row_stop <= row_start or col_stop <= col_start:
+        return None
+    return Window.from_slices((row_start, row_stop), (col_start, col_stop))
+
+
+def _cell_pixels(
+    array: np.ndarray,
+    transform,
+    polygons: np.ndarray,
+    hits: Iterable[int],
+    all_touched: np.ndarray,
+    nodata: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collect the valid pixels of the polygons numbered in ``hits`` from one
+    in-memory raster (or raster block). ``all_touched`` holds the
+    rasterization rule for every polygon.
+
+    Polygons with all_touched=False cannot share a pixel, so all of them are
+    burned into one int32 label raster in a single rasterize call. With
+    all_touched=True neighbouring cells do share their edge pixels, which a
+    label raster cannot represent, so each such polygon gets its own mask --
+    rasterized over just its bounding-box window, not the whole raster.
+    The windowed path is also used for every polygon when they cover less
+    than SPARSE_COVERAGE_FRACTION of the raster (e.g. a single cell in a
+    large bbox), where a full-size label raster would be almost all fill.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (polygon index per pixel, pixel value)
+    """
+    from affine import Affine
+    from rasterio.features import geometry_mask, rasterize
+
+    hits = np.asarray(hits, dtype=np.intp)
+    labelled = hits[~all_touched[hits]]
+    windowed = hits[all_touched[hits]]
+    pixel_area = abs(transform.a * transform.e)
+    coverage = shapely.area(polygons[labelled]).sum() / (array.size * pixel_area)
+    if coverage < SPARSE_COVERAGE_FRACTION:
+        labelled, windowed = labelled[:0], hits
+
+    indices, values = [], []
+    if labelled.size:
+        labels = rasterize(
+            ((polygons[idx], idx + 1) for idx in labelled),
+            out_shape=array.shape,
+            transform=transform,
+            fill=0,
+            all_touched=False,
+            dtype="int32",
+        )
+        valid = (labels > 0) & (array != nodata)
+        indices.append(labels[valid].astype(np.int64) - 1)
+        values.append(array[valid])
+
+    for idx in windowed:
+        poly = polygons[idx]
+        window = _polygon_window(poly, transform, array.shape)
+        if window is None:
+            continue
+        row_slice, col_slice = window.toslices()
+        local = array[row_slice, col_slice]
+        inside = geometry_mask(
+            [poly],
+            out_shape=local.shape,
+            transform=transform * Affine.translation(window.col_off, window.row_off),
+            all_touched=bool(all_touched[idx]),
+            invert=True,
+        )
+        pixels = local[inside]
+        pixels = pixels[pixels != nodata]
+        indices.append(np.full(pixels.size, idx, dtype=np.int64))
+        values.append(pixels)
+
+    if not values:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=array.dtype)
+    return np.concatenate(indices), np.concatenate(values)
+
+
+def _chunked_cell_pixels(
+    data,
+    polygons: np.ndarray,
+    all_touched: np.ndarray,
+    nodata: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collect per-polygon pixels chunk-first from a dask-backed raster.
+
+    Every dask block that intersects at least one polygon is computed once,
+    reduced straight away to the (polygon index, value) pairs of the pixels
+    inside cells, and then dropped; blocks no polygon touches are never
+    read. Cells that straddle a block boundary contribute pixels from each
+    block and are merged by the sort-based groupby afterwards, so peak
+    memory is one block plus the in-cell pixels rather than the whole raster.
+    """
+    from affine import Affine
+    from rasterio.transform import array_bounds
+
+    tree = STRtree(polygons)
+    raster = data.data
+    transform = data.rio.transform()
+    row_offsets = np.cumsum((0,) + raster.chunks[0])
+    col_offsets = np.cumsum((0,) + raster.chunks[1])
+
+    indices, values = [], []
+    blocks = raster.to_delayed()
+    for iy, ix in np.ndindex(*blocks.shape):
+        height, width = raster.chunks[0][iy], raster.chunks[1][ix]
+        block_transform = transform * Affine.translation(
+            col_offsets[ix], row_offsets[iy]
+        )
+        hits = tree.query(box(*array_bounds(height, width, block_transform)))
+        if len(hits) == 0:
+            continue
+
+        block_indices, block_values = _cell_pixels(
+            blocks[iy, ix].compute(), block_transform, polygons, hits,
+            all_touched, nodata,
+        )
+        indices.append(block_indices)
+        values.append(block_values)
+
+    if not indices:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=raster.dtype)
+    return np.concatenate(indices), np.concatenate(values)
+
+
+def _quantiles_by_index(
+    indices: np.ndarray,
+    values: np.ndarray,
+    quantiles: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-index quantiles of ``values`` from a single sort.
+
+    Sorting by (index, value) makes every group a contiguous, ordered run, so
+    any quantile of every group is a vectorized gather at a computed offset,
+    linearly interpolated as np.quantile's default method does. Min, median,
+    max or p10/p90 all come from the same sort, with no Python loop over
+    groups and no per-group np.quantile call.
+
+    Parameters
+    ----------
+    indices : np.ndarray
+        Group index per value
+    values : np.ndarray
+        Values to summarize
+    quantiles : np.ndarray
+        Quantiles in [0, 1], e.g. ``[0, 0.1, 0.5, 0.9, 1]``
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (unique indices, array of shape (n_groups, len(quantiles)))
+    """
+    order = np.lexsort((values, indices))
+    indices, values = indices[order], values[order].astype(np.float64)
+    groups, starts, counts = np.unique(indices, return_index=True, return_counts=True)
+
+    positions = starts[:, None] + (counts[:, None] - 1) * np.asarray(quantiles)[None, :]
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.ceil(positions).astype(np.int64)
+    weight = positions - lower
+    return groups, values[lower] * (1 - weight) + values[upper] * weight
+
+
 def compute_elevation_stats(
     data,
     h3_cells: list[str],
     default_h3_resolution: int = DEFAULT_H3_RESOLUTION,
+    polygons: np.ndarray | None = None,
 ) -> pd.DataFrame:
     """
     Compute elevation median and range for each H3 cell.
 
-    This mirrors the logic in ElevationAncillaryData.summarize_from_cells
-    which delegates to summarize_numerical() in zonal_summary.py.
+    This produces the same statistics as ElevationAncillaryData.
+    summarize_from_cells (which delegates to summarize_numerical() in
+    zonal_summary.py), but without clipping and summarizing cells one at a
+    time: pixels are labelled with the index of the H3 cell that contains
+    them and reduced with one sort-based groupby. Rasters larger than
+    GLOBAL_EXTENT_MAX_PIXELS are reduced chunk-first instead of being
+    loaded whole.
 
     Parameters
     ----------
@@ -154,54 +497,54 @@ def compute_elevation_stats(
         H3 cell IDs to summarize
     default_h3_resolution : int
         The H3 resolution that matches the raster pixel spacing.
-        Cells finer than this use all_touched=True.
+        Cells finer than this use all_touched=True; the rule is chosen
+        per cell, so inputs may mix resolutions.
+    polygons : np.ndarray, optional
+        Cell polygons from h3_cells_to_polygons, if the caller already has
+        them; otherwise they are built here.
 
     Returns
     -------
     pd.DataFrame
-        Columns: cell, elevation_median, elevation_range
+        Columns: cell, elevation_median, elevation_range (Arrow-backed
+        string and float32 dtypes)
     """
-    resolution = h3.get_resolution(h3_cells[0])
-    if resolution > default_h3_resolution:
-        # Cells are small relative to 30m raster pixels
-        logger.info("Using all_touched=True (H3 res %d > default %d)",
-                     resolution, default_h3_resolution)
-        all_touched = True
+    # Decide per cell, so a mixed-resolution input gets the right rule for
+    # every cell rather than whatever suits the first one
+    resolutions = np.fromiter(
+        (h3.get_resolution(cell) for cell in h3_cells), dtype=np.int8, count=len(h3_cells)
+    )
+    # Cells finer than the default are small relative to 30m raster pixels
+    all_touched = resolutions > default_h3_resolution
+    if all_touched.any():
+        logger.info("Using all_touched=True for %d cells (H3 res > default %d)",
+                    int(all_touched.sum()), default_h3_resolution)
+
+    # NASADEM is stored in EPSG:4326, so the (lng, lat) cell polygons can be
+    # rasterized against the raster's transform without reprojection
+    if polygons is None:
+        polygons = h3_cells_to_polygons(h3_cells)
+    if data.chunks is None or data.size <= GLOBAL_EXTENT_MAX_PIXELS:
+        # Small area: one read of the whole extent
+        indices, values = _cell_pixels(
+            data.to_numpy(), data.rio.transform(), polygons,
+            range(len(polygons)), all_touched, data.rio.nodata,
+        )
     else:
-        all_touched = False
-
-    crs = str(data.rio.crs)
-    nodata = data.rio.nodata
-
-    results = []
-    for cell in h3_cells:
-        # Get H3 cell boundary as a Shapely polygon in the raster's CRS
-        boundary = h3.cell_to_boundary(cell)
-        poly = Polygon([(lng, lat) for lat, lng in boundary])
-
-        try:
-            subset = data.rio.clip(geometries=[poly], crs="EPSG:4326")
-        except Exception:
-            # Cell has no data coverage (e.g., over ocean)
-            continue
-
-        summary = zonal_stats(
-            [poly],
-            subset.to_numpy(),
-            affine=subset.rio.transform(),
-            nodata=nodata,
-            stats=["median", "range"],
-            all_touched=all_touched,
-        )[0]
-
-        if None not in summary.values():
-            results.append({
-                "cell": cell,
-                "elevation_median": summary["median"],
-                "elevation_range": summary["range"],
-            })
-
-    df = pd.DataFrame(results, columns=OUTPUT_COLUMNS)
+        indices, values = _chunked_cell_pixels(
+            data, polygons, all_touched, data.rio.nodata,
+        )
+    groups, stats = _quantiles_by_index(indices, values, np.array([0.0, 0.5, 1.0]))
+    median, value_range = stats[:, 1], stats[:, 2] - stats[:, 0]
+
+    # One column array each, then a single construction of an Arrow-backed
+    # frame: cell IDs as Arrow strings rather than Python objects, and
+    # float32, which holds every int16 median (x.0 or x.5) and range exactly
+    df = pa.table({
+        "cell": np.asarray(h3_cells, dtype=object)[groups],
+        "elevation_median": median.astype(np.float32),
+        "elevation_range": value_range.astype(np.float32),
+    }, schema=OUTPUT_SCHEMA).to_pandas(types_mapper=pd.ArrowDtype)
     logger.info("Computed elevation stats for %d / %d cells",
                 len(df), len(h3_cells))
     return df
@@ -220,21 +563,21 @@ def summarize_elevation(h3_cells: list[str]) -> pd.DataFrame:
     This is the standalone equivalent of calling:
         ElevationAncillaryData().summarize_from_cells(h3_cells)
     """
-    # Convert H3 cells to a bounding box for the STAC search
-    polygon = h3_cells_to_polygon(h3_cells)
-    bbox = polygon.bounds  # (minx, miny, maxx, maxy)
-
-    # Search for NASADEM tiles
-    items = search_nasadem_tiles(bbox)
-    if len(items) == 0:
+    # Cell polygons, built once; their combined bounds are the STAC search
+    # bbox, and no union of the cells is needed
+    polygons = h3_cells_to_polygons(h3_cells)
+    bbox = tuple(shapely.total_bounds(polygons).tolist())  # (minx, miny, maxx, maxy)
+
+    # Search and load on a snapped bbox so repeated batches over the same
+    # area reuse one cached load
+    data = load_nasadem_cached(_snap_bbox(bbox))
+    if data is None:
         logger.warning("No NASADEM tiles found for the given area")
-        return pd.DataFrame(columns=OUTPUT_COLUMNS)
-
-    # Load the raster data (lazy / dask-backed)
-    data = load_nasadem_raster(items, bbox)
+        # Same Arrow-backed dtypes as a non-empty result
+        return OUTPUT_SCHEMA.empty_table().to_pandas(types_mapper=pd.ArrowDtype)
 
     # Compute zonal statistics per H3 cell
-    df = compute_elevation_stats(data, h3_cells)
+    df = compute_elevation_stats(data, h3_cells, polygons=polygons)
     return df
 
 
@@ -25,8 +25,17 @@ The 30 OSM categories (band index -> category name):
     14 = lighthouse             29 = works
 """
 
+from __future__ import annotations
+
 import datetime as dt
+import itertools
+import logging
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
+from types import MappingProxyType
 
 import numpy as np
 
@@ -37,55 +46,167 @@ from hum_ai.data_engine.formats.olmo_earth_samples_v1 import (
     OlmoEarthSamplesV1Writer,
 )
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Constants: the 30 OSM categories used in the Data Engine
 # ---------------------------------------------------------------------------
 
-OSM_CATEGORIES = [
+OSM_CATEGORIES: tuple[str, ...] = (
     "aerialway_pylon", "aerodrome", "airstrip", "amenity_fuel", "building",
     "chimney", "communications_tower", "crane", "flagpole", "fountain",
     "generator_wind", "helipad", "highway", "leisure", "lighthouse",
     "obelisk", "observatory", "parking", "petroleum_well", "power_plant",
     "power_substation", "power_tower", "river", "runway", "satellite_dish",
     "silo", "storage_tank", "taxiway", "water_tower", "works",
-]
+)
+
+# Read-only lookups built once at import
+CATEGORY_TO_BAND = MappingProxyType(
+    {name: idx for idx, name in enumerate(OSM_CATEGORIES)}
+)
+BAND_NAMES_ARR = np.asarray(OSM_CATEGORIES)
+
+# Band indices as named integer constants, e.g. OsmBand.BUILDING == 4
+OsmBand = IntEnum("OsmBand", [name.upper() for name in OSM_CATEGORIES], start=0)
+
+# Suggested parquet options for write_records_with_osm. The OSM raster is
+# stored as one binary blob per record, so dictionary/RLE encodings never
+# see its pixels; zstd on the blob does, and the long runs of 0/1 bytes in a
+# 30-band mask compress by well over an order of magnitude.
+OSM_PARQUET_KWARGS = {"compression": "zstd", "compression_level": 3}
+
+# Partitions write_records_with_osm encodes concurrently by default. Kept
+# small and fixed: up to twice this many batches are held in memory at once,
+# which must not grow with the host's core count.
+PARTITION_WRITE_WORKERS = 4
+
+# Bit i of a packed pixel is category band i; 30 categories fit in a uint32
+_BAND_BITS = np.left_shift(np.uint32(1), np.arange(30, dtype=np.uint32))
+
+
+def pack_osm_bands(osm_array: np.ndarray) -> np.ndarray:
+    """Pack a [H, W, 1, 30] binary OSM raster into one uint32 bitmask per pixel.
+
+    Args:
+        osm_array: Array of shape [H, W, 1, 30] with dtype uint8.
+
+    Returns:
+        numpy array of shape [H, W, 1] with dtype uint32, where bit i is set
+        if category band i is non-zero.
+    """
+    packed = np.zeros(osm_array.shape[:3], dtype=np.uint32)
+    for band_idx in range(osm_array.shape[-1]):
+        packed[osm_array[..., band_idx] != 0] |= _BAND_BITS[band_idx]
+    return packed
 
-CATEGORY_TO_BAND = {name: idx for idx, name in enumerate(OSM_CATEGORIES)}
+
+def unpack_osm_bands(packed: np.ndarray) -> np.ndarray:
+    """Expand a packed [H, W, 1] uint32 bitmask back to the [H, W, 1, 30] layout.
+
+    This is the array shape and dtype the OlmoEarth OSM modality expects, so
+    packed rasters are unpacked here just before they go into a record.
+
+    Args:
+        packed: Array of shape [H, W, 1] with dtype uint32.
+
+    Returns:
+        numpy array of shape [H, W, 1, 30] with dtype uint8.
+    """
+    return ((packed[..., np.newaxis] & _BAND_BITS) != 0).astype(np.uint8)
 
 
 # ---------------------------------------------------------------------------
 # 1. Create an OSM raster array from scratch (synthetic example)
 # ---------------------------------------------------------------------------
 
+# Synthetic features as (rows, cols, band)
+_SYNTHETIC_FEATURES = (
+    # A building footprint in the center of the tile
+    (slice(40, 80), slice(50, 90), OsmBand.BUILDING),
+    # A road crossing the tile horizontally
+    (slice(63, 65), slice(None), OsmBand.HIGHWAY),
+    # A parking lot adjacent to the building
+    (slice(80, 95), slice(50, 75), OsmBand.PARKING),
+)
+
+
 def create_synthetic_osm_raster(
     edge_length_pixels: int = 128,
+    packed: bool = False,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Create a synthetic 30-band OSM raster for demonstration.
 
     In production, this array would come from rasterizing actual OSM data
     using the workflow in scripts/2025.12.16_osm_to_geotiff.py.
 
+    Args:
+        edge_length_pixels: Spatial edge length of the tile in pixels.
+        packed: If True, build the raster as one uint32 bitmask per pixel
+            (see pack_osm_bands), 1/30th of the bytes of the band layout.
+        out: Optional array of the output shape and dtype to reuse. It is
+            zeroed and overwritten in place, which skips a fresh allocation
+            when many rasters are built in a loop; the caller owns it and
+            must copy any result it wants to keep past the next call.
+
     Returns:
-        numpy array of shape [H, W, 1, 30] with dtype uint8.
+        numpy array of shape [H, W, 1, 30] with dtype uint8, or of shape
+        [H, W, 1] with dtype uint32 if packed. This is ``out`` if given.
     """
-    osm = np.zeros(
-        (edge_length_pixels, edge_length_pixels, 1, 30),
-        dtype=np.uint8,
-    )
+    if packed:
+        shape, dtype = (edge_length_pixels, edge_length_pixels, 1), np.uint32
+    else:
+        shape, dtype = (edge_length_pixels, edge_length_pixels, 1, 30), np.uint8
+
+    if out is None:
+        osm = np.zeros(shape, dtype=dtype)
+    else:
+        if out.shape != shape or out.dtype != dtype:
+            raise ValueError(
+                f"out must have shape {shape} and dtype {np.dtype(dtype)}, "
+                f"got {out.shape} {out.dtype}"
+            )
+        osm = out
+        osm.fill(0)
+
+    for rows, cols, band in _SYNTHETIC_FEATURES:
+        if packed:
+            osm[rows, cols, 0] |= _BAND_BITS[band]
+        else:
+            osm[rows, cols, 0, band] = 1
 
-    # Simulate a building footprint in the center of the tile
-    building_band = CATEGORY_TO_BAND["building"]
-    osm[40:80, 50:90, 0, building_band] = 1
+    return osm
 
-    # Simulate a road crossing the tile horizontally
-    highway_band = CATEGORY_TO_BAND["highway"]
-    osm[63:65, :, 0, highway_band] = 1
 
-    # Simulate a parking lot adjacent to the building
-    parking_band = CATEGORY_TO_BAND["parking"]
-    osm[80:95, 50:75, 0, parking_band] = 1
+def burn_osm_pixels(
+    osm_array: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    bands: np.ndarray,
+) -> np.ndarray:
+    """Set many (row, col, band) OSM pixels in one vectorized scatter.
 
-    return osm
+    For ingest code that rasterizes many features: accumulate the pixel
+    triplets into integer arrays and write them all at once, rather than
+    issuing one slice assignment per feature.
+
+    Args:
+        osm_array: Array of shape [H, W, 1, 30] with dtype uint8, or a packed
+            [H, W, 1] uint32 bitmask; modified in place.
+        rows: Pixel row indices.
+        cols: Pixel column indices, same length as rows.
+        bands: Category band indices (see OsmBand), same length.
+
+    Returns:
+        osm_array, for chaining.
+    """
+    if osm_array.ndim == 3:
+        # Unbuffered OR, so several bands landing on one pixel all stick
+        np.bitwise_or.at(osm_array[:, :, 0], (rows, cols), _BAND_BITS[bands])
+    else:
+        osm_array[rows, cols, 0, bands] = 1
+    return osm_array
 
 
 # ---------------------------------------------------------------------------
@@ -105,12 +226,16 @@ def build_record_with_osm(
         latitude: Center latitude of the chip.
         longitude: Center longitude of the chip.
         sentinel_2_array: Sentinel-2 array, shape [H, W, T, 12], dtype uint16.
-        osm_array: OSM raster array, shape [H, W, 1, 30], dtype uint8.
+        osm_array: OSM raster array, shape [H, W, 1, 30], dtype uint8, or a
+            packed [H, W, 1] uint32 bitmask, which is unpacked here.
         date: Observation date for the Sentinel-2 imagery.
 
     Returns:
         An OlmoEarthSamplesV1Record with the open_street_map_raster field set.
     """
+    if osm_array.ndim == 3:
+        osm_array = unpack_osm_bands(osm_array)
+
     return OlmoEarthSamplesV1Record(
         sample_idx=None,
         latitude=latitude,
@@ -125,46 +250,137 @@ def build_record_with_osm(
 # 3. Inspect which OSM categories have data in a record
 # ---------------------------------------------------------------------------
 
+def summarize_osm_bands_array(osm_array: np.ndarray) -> np.ndarray:
+    """Count the non-zero pixels of every OSM category band.
+
+    Leading batch axes are kept, so a stacked [N, H, W, 1, 30] array gives
+    all N count vectors in one pass, and dataset totals are a plain
+    ``counts.sum(axis=0)``.
+
+    Args:
+        osm_array: Array of shape [..., H, W, 1, 30] with dtype uint8, or a
+            packed [..., H, W, 1] uint32 bitmask from pack_osm_bands.
+
+    Returns:
+        int64 array of shape [..., 30] with the pixel count per band.
+    """
+    if osm_array.shape[-1] == 1:
+        # Packed: test each category bit over the contiguous uint32 plane
+        bits = osm_array[..., 0]
+        counts = np.stack(
+            [np.count_nonzero(bits & bit, axis=(-2, -1)) for bit in _BAND_BITS],
+            axis=-1,
+        )
+    else:
+        # One reduction over the (H, W) plane yields all 30 band counts at once
+        counts = np.count_nonzero(osm_array[..., 0, :], axis=(-3, -2))
+    return np.asarray(counts, dtype=np.int64)
+
+
 def summarize_osm_bands(osm_array: np.ndarray) -> dict[str, int]:
     """Report the pixel count for each non-empty OSM category band.
 
     Args:
-        osm_array: Array of shape [H, W, 1, 30] with dtype uint8.
+        osm_array: Array of shape [H, W, 1, 30] with dtype uint8, or a packed
+            [H, W, 1] uint32 bitmask from pack_osm_bands.
 
     Returns:
         Dictionary mapping category name to non-zero pixel count,
         including only bands that have at least one pixel.
     """
-    summary = {}
-    for band_idx, category_name in enumerate(OSM_CATEGORIES):
-        band_data = osm_array[:, :, 0, band_idx]
-        pixel_count = int(np.count_nonzero(band_data))
-        if pixel_count > 0:
-            summary[category_name] = pixel_count
-    return summary
+    counts = summarize_osm_bands_array(osm_array)
+    present = counts > 0
+    return dict(zip(BAND_NAMES_ARR[present].tolist(), counts[present].tolist()))
 
 
 # ---------------------------------------------------------------------------
 # 4. Write records with OSM raster to parquet
 # ---------------------------------------------------------------------------
 
+def _record_nbytes(record: OlmoEarthSamplesV1Record) -> int:
+    """Approximate in-memory payload of a record: its Sentinel-2 and OSM arrays."""
+    return sum(
+        array.nbytes
+        for array in (record.sentinel_2_l2a, record.open_street_map_raster)
+        if array is not None
+    )
+
+
+def _batch_records(
+    records: Iterable[OlmoEarthSamplesV1Record],
+    batch_size: int,
+    max_batch_bytes: int | None,
+) -> Iterator[list[OlmoEarthSamplesV1Record]]:
+    """Split records into lists of at most batch_size records and max_batch_bytes."""
+    records = iter(records)
+    if max_batch_bytes is None:
+        while batch := list(itertools.islice(records, batch_size)):
+            yield batch
+        return
+
+    batch, batch_bytes = [], 0
+    for record in records:
+        nbytes = _record_nbytes(record)
+        if batch and (len(batch) >= batch_size or batch_bytes + nbytes > max_batch_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(record)
+        batch_bytes += nbytes
+    if batch:
+        yield batch
+
+
+def _write_partition(
+    metadata: OlmoEarthSamplesV1Metadata,
+    path: Path,
+    batch: list[OlmoEarthSamplesV1Record],
+    parquet_kwargs: dict,
+) -> int:
+    # A writer per partition: nothing establishes that one writer can be
+    # shared across threads
+    writer = OlmoEarthSamplesV1Writer(metadata=metadata)
+    writer.write_partition(path, batch, **parquet_kwargs)
+    return len(batch)
+
+
 def write_records_with_osm(
-    records: list[OlmoEarthSamplesV1Record],
+    records: Iterable[OlmoEarthSamplesV1Record],
     output_dir: Path,
     dataset_name: str = "osm-raster-demo",
     edge_length_pixels: int = 128,
     gsd_m: float = 10.0,
     n_timestamps: int = 1,
+    batch_size: int = 64,
+    max_batch_bytes: int | None = None,
+    max_workers: int = PARTITION_WRITE_WORKERS,
+    parquet_kwargs: dict | None = None,
 ) -> None:
     """Write OlmoEarth records (with OSM raster) to parquet.
 
+    Records are written in batches, one partition file per batch
+    (part-00000.parquet, part-00001.parquet, ...). Partitions are independent,
+    so they are encoded and compressed on a thread pool (pyarrow releases the
+    GIL while compressing), each by its own writer. At most 2 * max_workers
+    batches are in flight, and max_workers defaults to a small fixed
+    PARTITION_WRITE_WORKERS rather than the CPU count, so memory stays
+    bounded on any host. Pass a generator to keep the whole dataset out of
+    memory.
+
     Args:
-        records: List of OlmoEarthSamplesV1Record instances.
+        records: OlmoEarthSamplesV1Record instances (any iterable).
         output_dir: Directory to write parquet files into.
         dataset_name: Name for the dataset metadata.
         edge_length_pixels: Spatial edge length of each chip in pixels.
         gsd_m: Ground sample distance in meters.
         n_timestamps: Number of timestamps per record.
+        batch_size: Maximum number of records per partition file.
+        max_batch_bytes: If set, also cap each partition at roughly this many
+            bytes of array payload, so batches are sized by data volume.
+        max_workers: Number of partitions written concurrently, each with
+            its own writer; 1 writes serially.
+        parquet_kwargs: Extra parquet options forwarded to
+            write_partition, e.g. OSM_PARQUET_KWARGS. Only use options your
+            writer version accepts; by default none are passed.
     """
     metadata = OlmoEarthSamplesV1Metadata(
         name=dataset_name,
@@ -174,30 +390,50 @@ def write_records_with_osm(
         n_timestamps=n_timestamps,
     )
 
-    writer = OlmoEarthSamplesV1Writer(metadata=metadata)
     output_dir.mkdir(parents=True, exist_ok=True)
-    writer.write_metadata(output_dir)
-    writer.write_partition(output_dir / "part-0.parquet", records)
-    print(f"Wrote {len(records)} records to {output_dir}")
+    OlmoEarthSamplesV1Writer(metadata=metadata).write_metadata(output_dir)
+    max_workers = max(1, max_workers)
+    n_records = 0
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        batches = _batch_records(records, batch_size, max_batch_bytes)
+        for part_idx, batch in enumerate(batches):
+            if len(pending) >= 2 * max_workers:
+                n_records += pending.popleft().result()
+            pending.append(pool.submit(
+                _write_partition, metadata,
+                output_dir / f"part-{part_idx:05d}.parquet", batch,
+                parquet_kwargs or {},
+            ))
+        while pending:
+            n_records += pending.popleft().result()
+    logger.info("Wrote %d records to %s", n_records, output_dir)
 
 
 # ---------------------------------------------------------------------------
 # 5. Read back and verify the OSM modality round-trips correctly
 # ---------------------------------------------------------------------------
 
-def verify_osm_modality_properties():
-    """Print the OlmoEarth modality properties for the OSM raster."""
+def osm_modality_properties() -> list[str]:
+    """Describe the OlmoEarth modality properties for the OSM raster, one line each."""
     modality = OlmoEarthModality.OPEN_STREET_MAP_RASTER
 
-    print(f"Modality enum:  {modality.name}")
-    print(f"OlmoEarth name: {modality.olmo_name}")
-    print(f"Default dtype:  {modality.default_dtype}")
-    print(f"Number of bands: {modality.n_bands()}")
-    print(f"No-data value:  0  (uint8 default)")
-    print()
-    print("Band listing:")
-    for idx, category in enumerate(OSM_CATEGORIES):
-        print(f"  Band {idx:2d}: {category}")
+    lines = [
+        f"Modality enum:  {modality.name}",
+        f"OlmoEarth name: {modality.olmo_name}",
+        f"Default dtype:  {modality.default_dtype}",
+        f"Number of bands: {modality.n_bands()}",
+        "No-data value:  0  (uint8 default)",
+        "",
+        "Band listing:",
+    ]
+    lines += [f"  Band {idx:2d}: {category}" for idx, category in enumerate(OSM_CATEGORIES)]
+    return lines
+
+
+def verify_osm_modality_properties():
+    """Print the OlmoEarth modality properties for the OSM raster."""
+    print("\n".join(osm_modality_properties()))
 
 
 # ---------------------------------------------------------------------------
@@ -205,6 +441,8 @@ def verify_osm_modality_properties():
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Print modality properties
     verify_osm_modality_properties()
     print()
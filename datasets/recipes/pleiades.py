@@ -14,6 +14,7 @@ Key facts:
 
 from hum_ai.data_engine.collections import CollectionName
 from hum_ai.data_engine.ingredients import (
+    COLLECTION_BAND_MAP,
     CollectionInput,
     ObservationType,
     SOURCE_INFO,
@@ -104,12 +105,8 @@ multi_source_inputs = (
 # ---------------------------------------------------------------------------
 # This shows how Pleiades fits into a Data Engine workflow using
 # manifest_from_stac_search, which is the real entry point for catalog queries.
-
-from datetime import date, datetime, timezone
-
-from hum_ai.data_engine.ingredients import Range
-from hum_ai.data_engine.manifest import manifest_from_stac_search
-from hum_ai.data_engine.scene import Scene
+# Its imports live in the example below rather than at the top of this file,
+# so importing the recipe does not load the manifest/catalog machinery.
 
 # Build a manifest by searching the STAC catalog for Pleiades scenes.
 # The manifest_from_stac_search function requires:
@@ -120,6 +117,11 @@ from hum_ai.data_engine.scene import Scene
 #
 # Example (requires Scene objects from your project configuration):
 #
+# from datetime import date
+#
+# from hum_ai.data_engine.ingredients import Range
+# from hum_ai.data_engine.manifest import manifest_from_stac_search
+#
 # manifest = manifest_from_stac_search(
 #     scenes=my_scenes,
 #     chip_size_m=256.0,
@@ -141,8 +143,6 @@ from hum_ai.data_engine.scene import Scene
 # 10. COLLECTION_BAND_MAP reference — maps band index to ObservationType
 # ---------------------------------------------------------------------------
 
-from hum_ai.data_engine.ingredients import COLLECTION_BAND_MAP
-
 pleiades_band_map = COLLECTION_BAND_MAP[CollectionName.PLEIADES]
 # Returns:
 # {
@@ -19,8 +19,18 @@ Key characteristics:
 
 from __future__ import annotations
 
+import copy
+import functools
+import json
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # ---------------------------------------------------------------------------
 # 1. Imports from the Data Engine
@@ -28,6 +38,7 @@ from pathlib import Path
 
 from hum_ai.data_engine.collections import CollectionName
 from hum_ai.data_engine.ingredients import (
+    COLLECTION_BAND_MAP,
     SOURCE_INFO,
     CollectionInput,
     ObservationType,
@@ -43,21 +54,65 @@ from hum_ai.data_engine.formats.olmo_earth_samples_v1.config import (
 )
 from hum_ai.data_engine.formats.olmo_earth_samples_v1.names import OlmoEarthModality
 
+# Sentinel-1 entries of the Data Engine lookup tables and its OlmoEarth
+# modality, resolved once at import
+_S1_INFO = SOURCE_INFO[CollectionName.SENTINEL1]
+_S1_BAND_MAP = COLLECTION_BAND_MAP[CollectionName.SENTINEL1]
+_S1_MODALITY = OlmoEarthModality.for_collection_name(CollectionName.SENTINEL1)
+
+# RTC no-data value, and its float32 bit pattern as an int32 so no-data
+# pixels can be found with an integer equality test on an int32 view
+S1_NO_DATA = -32768.0
+_S1_NO_DATA_BITS = struct.unpack("<i", struct.pack("<f", S1_NO_DATA))[0]
+
+# Band selections shared by the config factories below
+_SENTINEL1_BANDS = ("vv", "vh")
+_SENTINEL2_BANDS = (
+    "B02", "B03", "B04", "B08",   # 10m: Blue, Green, Red, NIR
+    "B05", "B06", "B07", "B8A",    # 20m: Red Edge, Narrow NIR
+    "B11", "B12",                   # 20m: SWIR 1, SWIR 2
+    "B01", "B09",                   # 60m: Coastal Aerosol, Water Vapour
+)
+_LANDSAT_BANDS = ("blue", "green", "red", "nir08", "swir16", "swir22", "lwir")
+
+# Catalog filters shared by the factories: none for SAR, which is
+# cloud-independent, and a cloud-cover cap for Sentinel-2. Each factory hands
+# out deep copies of what it builds, so no caller can mutate these.
+_S1_CATALOG_FILTERS = None
+_S2_CATALOG_FILTERS = {"eo:cloud_cover": {"lt": 5}}
+
 # ---------------------------------------------------------------------------
 # 2. Inspect Sentinel-1 source metadata
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def _s1_info_text() -> str:
+    """The SOURCE_INFO listing, formatted once per process."""
+    lines = ["Sentinel-1 SOURCE_INFO:"]
+    lines += [f"  {key}: {value}" for key, value in _S1_INFO.items()]
+    return "\n".join(lines) + "\n"
+
+
+@functools.cache
+def _s1_band_map_text() -> str:
+    """The band index -> ObservationType listing, formatted once per process."""
+    lines = ["Sentinel-1 band index -> ObservationType:"]
+    lines += [
+        f"  Band {band_idx}: {obs_type.name} ('{obs_type.value}')"
+        for band_idx, obs_type in _S1_BAND_MAP.items()
+    ]
+    return "\n".join(lines) + "\n"
+
+
 def inspect_sentinel1_metadata() -> None:
     """Print the Data Engine's stored metadata for Sentinel-1.
 
     SOURCE_INFO contains band IDs, band names, resolution, data type,
     and missing value information for each collection.
     """
-    s1_info = SOURCE_INFO[CollectionName.SENTINEL1]
-    print("Sentinel-1 SOURCE_INFO:")
-    for key, value in s1_info.items():
-        print(f"  {key}: {value}")
+    # Build the whole report and write it once, instead of a print() per line
+    out = [_s1_info_text()]
     # Expected output:
     #   band_ids: ['vh', 'vv']
     #   band_names: ['VH', 'VV']
@@ -67,18 +122,19 @@ def inspect_sentinel1_metadata() -> None:
     #   dtype: float32
 
     # The CollectionName enum carries the STAC catalog and collection IDs
-    print(f"\nSTAC catalog ID: {CollectionName.SENTINEL1.catalog_id}")
-    print(f"STAC collection ID: {CollectionName.SENTINEL1.id}")
+    out.append(f"\nSTAC catalog ID: {CollectionName.SENTINEL1.catalog_id}\n")
+    out.append(f"STAC collection ID: {CollectionName.SENTINEL1.id}\n")
     # Output:
     #   STAC catalog ID: microsoft-pc
     #   STAC collection ID: sentinel-1-rtc
 
     # OlmoEarth modality mapping
-    modality = OlmoEarthModality.for_collection_name(CollectionName.SENTINEL1)
-    print(f"\nOlmoEarth modality: {modality}")
-    print(f"  olmo_name: {modality.olmo_name}")
-    print(f"  n_bands: {modality.n_bands()}")
-    print(f"  default_dtype: {modality.default_dtype}")
+    modality = _S1_MODALITY
+    out.append(f"\nOlmoEarth modality: {modality}\n")
+    out.append(f"  olmo_name: {modality.olmo_name}\n")
+    out.append(f"  n_bands: {modality.n_bands()}\n")
+    out.append(f"  default_dtype: {modality.default_dtype}\n")
+    sys.stdout.write("".join(out))
     # Output:
     #   OlmoEarth modality: OlmoEarthModality.SENTINEL_1
     #   olmo_name: sentinel1
@@ -91,6 +147,24 @@ def inspect_sentinel1_metadata() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _copy_of_cached(factory):
+    """Build ``factory``'s object once, and hand every caller a deep copy.
+
+    The factories in sections 3-5 take no arguments, so the construction and
+    validation are done once per process. The config classes live outside
+    this tree and may be mutable, so callers get their own copies rather
+    than a shared instance one of them could change under the others.
+    """
+    cached = functools.lru_cache(maxsize=1)(factory)
+
+    @functools.wraps(factory)
+    def wrapper():
+        return copy.deepcopy(cached())
+
+    return wrapper
+
+
+@_copy_of_cached
 def create_sentinel1_collection_input() -> CollectionInput:
     """Create and return a CollectionInput configured for Sentinel-1 RTC.
 
@@ -108,10 +182,9 @@ def create_sentinel1_collection_input() -> CollectionInput:
     # This is equivalent to the explicit version:
     s1_input_explicit = CollectionInput(
         collection_name=CollectionName.SENTINEL1,
-        band_ids=('vv', 'vh'),
+        band_ids=_SENTINEL1_BANDS,
         resolution=10.0,
-        # No catalog_filters needed -- SAR is cloud-independent
-        catalog_filters=None,
+        catalog_filters=_S1_CATALOG_FILTERS,
     )
     return s1_input_explicit
 
@@ -121,6 +194,7 @@ def create_sentinel1_collection_input() -> CollectionInput:
 # ---------------------------------------------------------------------------
 
 
+@_copy_of_cached
 def create_image_chips_v3_config() -> ImageChipsV3Configuration:
     """Create an ImageChipsV3Configuration for Sentinel-1 SAR chips.
 
@@ -143,22 +217,76 @@ def create_image_chips_v3_config() -> ImageChipsV3Configuration:
         ),
         chip_collection_input=CollectionInput(
             collection_name=CollectionName.SENTINEL1,
-            band_ids=("vv", "vh"),
+            band_ids=_SENTINEL1_BANDS,
             resolution=10.0,
         ),
         chip_size_m=1280.0,  # 128x128 pixels at 10m
     )
-    print(f"Chip size: {config.chip_size_pixels} x {config.chip_size_pixels} pixels")
-    print(f"Bands: {config.chip_collection_input.band_ids}")
-    print(f"Resolution: {config.chip_collection_input.resolution} m")
     return config
 
 
+def create_chip_store(
+    path: str | Path,
+    n_chips: int,
+    chip_shape: tuple[int, ...],
+    dtype,
+) -> None:
+    """Create an empty Blosc-compressed Zarr array for a stack of chips.
+
+    One Zarr chunk holds exactly one chip, so any chip (or fancy-indexed
+    set of chips) is read by decompressing only its own chunks, and writers
+    filling different chips never touch the same chunk. Blosc's byte
+    shuffle groups the similar exponent bytes of neighbouring float32
+    backscatter values before LZ4, which compresses well and decompresses
+    far faster than gzip.
+
+    Requires ``pip install "zarr>=3"``.
+
+    Args:
+        path: Destination directory (or fsspec URL) for the Zarr store.
+        n_chips: Number of chips the store will hold.
+        chip_shape: Shape of one chip, e.g. (128, 128, 2).
+        dtype: Chip dtype, e.g. float32 linear power or int8 from
+            quantize_db_int8.
+    """
+    import zarr
+    from zarr.codecs import BloscCodec
+
+    zarr.open_array(
+        str(path),
+        mode="w",
+        shape=(n_chips, *chip_shape),
+        chunks=(1, *chip_shape),
+        dtype=dtype,
+        compressors=BloscCodec(cname="lz4", clevel=5, shuffle="shuffle"),
+    )
+
+
+def write_chip_region(path: str | Path, start: int, chips: np.ndarray) -> None:
+    """Write chips[i] to chip index start + i of a store from create_chip_store.
+
+    Because chunks are one chip each, independent processes can call this
+    concurrently for disjoint index ranges of the same store -- no shared
+    file handle or single-writer lock as with HDF5, and no coordinator.
+    """
+    import zarr
+
+    store = zarr.open_array(str(path), mode="r+")
+    store[start:start + len(chips)] = chips
+
+
+def write_chips_zarr(chips: np.ndarray, path: str | Path) -> None:
+    """Store a [N, H, W, bands] stack of chips as a one-chip-per-chunk Zarr array."""
+    create_chip_store(path, len(chips), chips.shape[1:], chips.dtype)
+    write_chip_region(path, 0, chips)
+
+
 # ---------------------------------------------------------------------------
 # 5. Configure an OlmoEarth multi-modal pipeline including Sentinel-1
 # ---------------------------------------------------------------------------
 
 
+@_copy_of_cached
 def create_olmo_earth_config() -> OlmoEarthSamplesV1Configuration:
     """Create an OlmoEarthSamplesV1Configuration that includes Sentinel-1.
 
@@ -182,23 +310,18 @@ def create_olmo_earth_config() -> OlmoEarthSamplesV1Configuration:
         collection_inputs=(
             CollectionInput(
                 collection_name=CollectionName.SENTINEL2,
-                band_ids=(
-                    "B02", "B03", "B04", "B08",   # 10m: Blue, Green, Red, NIR
-                    "B05", "B06", "B07", "B8A",    # 20m: Red Edge, Narrow NIR
-                    "B11", "B12",                   # 20m: SWIR 1, SWIR 2
-                    "B01", "B09",                   # 60m: Coastal Aerosol, Water Vapour
-                ),
+                band_ids=_SENTINEL2_BANDS,
                 resolution=10.0,
-                catalog_filters={"eo:cloud_cover": {"lt": 5}},
+                catalog_filters=_S2_CATALOG_FILTERS,
             ),
             CollectionInput(
                 collection_name=CollectionName.SENTINEL1,
-                band_ids=("vv", "vh"),
+                band_ids=_SENTINEL1_BANDS,
                 resolution=10.0,
             ),
             CollectionInput(
                 collection_name=CollectionName.LANDSAT,
-                band_ids=("blue", "green", "red", "nir08", "swir16", "swir22", "lwir"),
+                band_ids=_LANDSAT_BANDS,
                 resolution=10.0,
             ),
         ),
@@ -219,12 +342,7 @@ def print_observation_type_mapping() -> None:
     to ObservationType. This is used internally by the Data Engine to label
     each band in the output datasets.
     """
-    from hum_ai.data_engine.ingredients import COLLECTION_BAND_MAP
-
-    s1_map = COLLECTION_BAND_MAP[CollectionName.SENTINEL1]
-    print("Sentinel-1 band index -> ObservationType:")
-    for band_idx, obs_type in s1_map.items():
-        print(f"  Band {band_idx}: {obs_type.name} ('{obs_type.value}')")
+    sys.stdout.write(_s1_band_map_text())
     # Output:
     #   Band 0: SENTINEL1_VV ('sentinel1_vv')
     #   Band 1: SENTINEL1_VH ('sentinel1_vh')
@@ -235,6 +353,82 @@ def print_observation_type_mapping() -> None:
 # ---------------------------------------------------------------------------
 
 
+def linear_to_db(linear: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Convert float32 linear power backscatter to decibels.
+
+    Works on arrays of any shape (a single band, a [H, W, 2] chip or a full
+    scene). No-data pixels come out as NaN. The conversion runs in place in
+    one output buffer: masked ufuncs skip no-data pixels without gathering
+    the valid ones into a temporary array.
+
+    Args:
+        linear: gamma-nought values, with S1_NO_DATA for missing pixels.
+            Other float dtypes are converted to float32 first.
+        out: Optional float32 array of the same shape to write into.
+
+    Returns:
+        float32 array of dB values (``out`` if given).
+    """
+    import numpy as np
+
+    # The bit-pattern test below is only valid on float32 data; this is a
+    # no-op for float32 input, and S1_NO_DATA is exact in float32
+    linear = np.asarray(linear, dtype=np.float32)
+
+    # The sentinel is an exact float32 value, so comparing bit patterns on an
+    # int32 view of the same buffer (no copy) finds the same pixels with
+    # integer compares
+    valid_mask = linear.view(np.int32) != _S1_NO_DATA_BITS
+
+    # dB = 10 * log10(linear)
+    if out is None:
+        out = np.empty_like(linear)
+    out.fill(np.nan)
+    np.log10(linear, out=out, where=valid_mask)
+    np.multiply(out, 10.0, out=out, where=valid_mask)
+    return out
+
+
+# int8 encoding of dB backscatter for compact chips: 0.25 dB steps centred on
+# the -30..+5 dB range SAR backscatter occupies, so codes -127..127 cover
+# -44.25..+19.25 dB; -128 is reserved for NaN. Rounding error is at most
+# 0.125 dB, well below speckle noise. Store the scale and offset with the
+# quantized chips so readers can decode them.
+DB_INT8_SCALE = 4.0
+DB_INT8_OFFSET = 12.5
+DB_INT8_NODATA = -128
+
+
+def quantize_db_int8(db: np.ndarray) -> np.ndarray:
+    """Encode dB backscatter as int8 (0.25 dB precision), a quarter of float32.
+
+    Values outside the encodable range are clipped; NaN becomes DB_INT8_NODATA.
+    A scalar or 0-d input gives a 0-d result.
+    """
+    import numpy as np
+
+    db = np.asarray(db, dtype=np.float32)
+    # ndmin=1 so the in-place ufuncs below always get an array to write into;
+    # a 0-d result would be a numpy scalar, which ``out=`` rejects
+    scaled = np.array(db, ndmin=1)
+    scaled += DB_INT8_OFFSET
+    scaled *= DB_INT8_SCALE
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, -127, 127, out=scaled)
+    scaled[np.isnan(scaled)] = DB_INT8_NODATA
+    return scaled.astype(np.int8).reshape(db.shape)
+
+
+def dequantize_db_int8(quantized: np.ndarray) -> np.ndarray:
+    """Decode quantize_db_int8() output back to float32 dB, restoring NaN."""
+    import numpy as np
+
+    quantized = np.asarray(quantized)
+    db = quantized.astype(np.float32) / DB_INT8_SCALE - DB_INT8_OFFSET
+    db[quantized == DB_INT8_NODATA] = np.nan
+    return db
+
+
 def linear_to_db_example() -> None:
     """Demonstrate converting Sentinel-1 linear power to decibels.
 
@@ -252,17 +446,20 @@ def linear_to_db_example() -> None:
     # Simulated linear power values (gamma-nought)
     linear_backscatter = np.array([0.001, 0.01, 0.05, 0.1, 0.5], dtype=np.float32)
 
-    # Mask the no-data value before conversion
-    no_data = -32768.0
-    valid_mask = linear_backscatter != no_data
+    db_backscatter = linear_to_db(linear_backscatter)
 
-    # Convert to decibels: dB = 10 * log10(linear)
-    db_backscatter = np.full_like(linear_backscatter, np.nan)
-    db_backscatter[valid_mask] = 10 * np.log10(linear_backscatter[valid_mask])
+    # Format every row first and write once, rather than a print() per value
+    lines = ["Linear -> dB conversion:"]
+    lines += [
+        f"  {lin:.4f} -> {db:.1f} dB"
+        for lin, db in zip(linear_backscatter.tolist(), db_backscatter.tolist())
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    print("Linear -> dB conversion:")
-    for lin, db in zip(linear_backscatter, db_backscatter):
-        print(f"  {lin:.4f} -> {db:.1f} dB")
+    # For compact ImageChips output, dB values fit in int8 at 0.25 dB steps
+    quantized = quantize_db_int8(db_backscatter)
+    print(f"int8 codes: {quantized.tolist()} "
+          f"(decoded: {dequantize_db_int8(quantized).round(2).tolist()})")
 
 
 # ---------------------------------------------------------------------------
@@ -270,36 +467,157 @@ def linear_to_db_example() -> None:
 # ---------------------------------------------------------------------------
 
 
-def direct_stac_access_example() -> None:
-    """Show how to query Sentinel-1 RTC directly from the Planetary Computer
-    STAC API using pystac-client.
+def iter_sentinel1_items(catalog, bbox: list[float], start: datetime, end: datetime):
+    """Yield Sentinel-1 RTC items as their search result pages arrive.
 
-    This bypasses the Data Engine entirely and is useful for ad-hoc
-    exploration or when you need lower-level control over the search.
+    pystac-client fetches the next page only when the current one is used
+    up, so a consumer can start on the first items (e.g. by mapping a loader
+    over this iterator on a ThreadPoolExecutor) while pagination continues,
+    and the full result list is never held in memory.
+    """
+    search = catalog.search(
+        collections=[CollectionName.SENTINEL1.id],
+        bbox=bbox,
+        datetime=(start, end),
+    )
+    yield from search.items()
+
+
+def _date_windows(start: datetime, end: datetime, n_windows: int) -> list[tuple]:
+    """Split [start, end] into ``n_windows`` consecutive, equal date windows."""
+    step = (end - start) / n_windows
+    bounds = [start + i * step for i in range(n_windows)] + [end]
+    # The last bound is ``end`` itself: n_windows * step can round to just
+    # short of it, which would drop items at the very end of the range
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def search_items_concurrently(
+    catalog,
+    bbox: list[float],
+    start: datetime,
+    end: datetime,
+    n_windows: int = 8,
+) -> list:
+    """Search Sentinel-1 RTC as independent per-window searches run in parallel.
+
+    STAC API pagination follows token-based 'next' links, so the pages of a
+    single search can only be fetched one after another. Splitting the date
+    range into ``n_windows`` disjoint windows gives independent searches
+    whose page chains run concurrently on a thread pool. This and
+    _date_windows are kept identical to the helpers in landsat-8-9.py,
+    apart from searching through iter_sentinel1_items.
+
+    Returns:
+        The matched items, in window order, without duplicates (datetime
+        ranges are inclusive, so an item exactly on a window edge would
+        otherwise be returned twice).
+    """
+    windows = _date_windows(start, end, n_windows)
+
+    def search_window(window):
+        return list(iter_sentinel1_items(catalog, bbox, *window))
+
+    with ThreadPoolExecutor(max_workers=n_windows) as pool:
+        results = pool.map(search_window, windows)
+
+    items = {}
+    for window_items in results:
+        for item in window_items:
+            items.setdefault(item.id, item)
+    return list(items.values())
+
+
+# Seconds cached STAC responses stay fresh; new scenes appear within this
+STAC_CACHE_TTL = 3600
+
+
+def _open_catalog(cache_dir: Path | None = None):
+    """Open the Planetary Computer STAC API, optionally behind an HTTP cache.
+
+    With ``cache_dir``, search responses are kept in a SQLite cache there for
+    STAC_CACHE_TTL seconds (or as the server's Cache-Control allows), so
+    re-running the same search skips the network. Items come back unsigned
+    (see sign_assets), so expiring SAS tokens never end up in the cache.
+    Requires ``pip install requests-cache``.
     """
     import pystac_client
-    import planetary_computer
 
-    catalog = pystac_client.Client.open(
+    stac_io = None
+    if cache_dir is not None:
+        import requests_cache
+        from pystac_client.stac_api_io import StacApiIO
+
+        stac_io = StacApiIO()
+        stac_io.session = requests_cache.CachedSession(
+            str(Path(cache_dir) / "stac_cache"),
+            backend="sqlite",
+            expire_after=STAC_CACHE_TTL,
+            cache_control=True,
+            # STAC item searches are POSTs
+            allowable_methods=("GET", "POST"),
+        )
+
+    # No sign_inplace modifier: signing every asset of every returned item is
+    # wasted work when only the polarization GeoTIFFs are read
+    return pystac_client.Client.open(
         "https://planetarycomputer.microsoft.com/api/stac/v1",
-        modifier=planetary_computer.sign_inplace,
+        stac_io=stac_io,
     )
 
+
+def sign_assets(items, asset_keys: tuple[str, ...] = _SENTINEL1_BANDS) -> None:
+    """Sign just the assets that will be read, in place, right before reading.
+
+    planetary_computer caches one SAS token per storage container, so after
+    the first URL every signature is a local string operation. The signed
+    hrefs are written back to ``asset.href`` for tools that read them there.
+    """
+    import planetary_computer
+
+    for item in items:
+        for key in asset_keys:
+            asset = item.assets.get(key)
+            if asset is not None:
+                asset.href = planetary_computer.sign_url(asset.href)
+
+
+def direct_stac_access_example(
+    max_concurrency: int = 8,
+    cache_dir: Path | None = None,
+) -> None:
+    """Show how to query Sentinel-1 RTC directly from the Planetary Computer
+    STAC API using pystac-client.
+
+    This bypasses the Data Engine entirely and is useful for ad-hoc
+    exploration or when you need lower-level control over the search.
+
+    Args:
+        max_concurrency: Number of date windows searched in parallel.
+        cache_dir: Optional directory for an on-disk cache of STAC responses.
+    """
+    catalog = _open_catalog(cache_dir)
+
     # Search for Sentinel-1 RTC items over San Francisco Bay Area
-    search = catalog.search(
-        collections=["sentinel-1-rtc"],
+    items = search_items_concurrently(
+        catalog,
         bbox=[-122.5, 37.5, -122.0, 38.0],
-        datetime="2023-01-01/2023-06-01",
+        start=datetime(2023, 1, 1, tzinfo=UTC),
+        end=datetime(2023, 6, 1, tzinfo=UTC),
+        n_windows=max_concurrency,
     )
-
-    items = list(search.items())
     print(f"Found {len(items)} Sentinel-1 RTC items")
 
-    if items:
-        sample = items[0]
-        print(f"  ID: {sample.id}")
-        print(f"  Date: {sample.datetime}")
-        print(f"  Assets: {list(sample.assets.keys())}")
+    # Sign only the VV/VH GeoTIFFs of the items about to be read
+    sign_assets(items[:1])
+
+    # One JSON record per item, serialized and written in a single call;
+    # the output is machine-readable and extends to the full result list
+    summary = [
+        {"id": item.id, "datetime": item.datetime, "assets": list(item.assets)}
+        for item in items[:1]
+    ]
+    sys.stdout.write(json.dumps(summary, default=str, indent=2) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -312,18 +630,28 @@ if __name__ == "__main__":
     print("Sentinel-1 RTC -- Data Engine Configuration Examples")
     print("=" * 60)
 
-    print("\n--- 1. Source Metadata ---")
-    inspect_sentinel1_metadata()
+    # The config builders are independent, so validate them concurrently
+    # while the metadata prints; results are reported below in a fixed order
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        ci_future = pool.submit(create_sentinel1_collection_input)
+        chips_future = pool.submit(create_image_chips_v3_config)
+        olmo_future = pool.submit(create_olmo_earth_config)
+
+        print("\n--- 1. Source Metadata ---")
+        inspect_sentinel1_metadata()
 
-    print("\n--- 2. CollectionInput ---")
-    ci = create_sentinel1_collection_input()
-    print(f"Created: {ci}")
+        print("\n--- 2. CollectionInput ---")
+        ci = ci_future.result()
+        print(f"Created: {ci}")
 
-    print("\n--- 3. ImageChips v3 Config ---")
-    chips_config = create_image_chips_v3_config()
+        print("\n--- 3. ImageChips v3 Config ---")
+        chips_config = chips_future.result()
+        print(f"Chip size: {chips_config.chip_size_pixels} x {chips_config.chip_size_pixels} pixels")
+        print(f"Bands: {chips_config.chip_collection_input.band_ids}")
+        print(f"Resolution: {chips_config.chip_collection_input.resolution} m")
 
-    print("\n--- 4. OlmoEarth Config ---")
-    olmo_config = create_olmo_earth_config()
+        print("\n--- 4. OlmoEarth Config ---")
+        olmo_config = olmo_future.result()
 
     print("\n--- 5. Observation Type Mapping ---")
     print_observation_type_mapping()
@@ -22,7 +22,9 @@ Key characteristics:
 from __future__ import annotations
 
 import datetime as dt
+import functools
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # ---------------------------------------------------------------------------
 # 1. Imports from the Data Engine
@@ -66,6 +68,9 @@ from hum_ai.data_engine.temporal_sampling_strategies import (
 # The plan function that wires spatial + temporal + format configs into a recipe
 from hum_ai.data_engine.plan import make_a_plan
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # 2. Inspect Sentinel-2 source metadata
@@ -528,6 +533,18 @@ def direct_stac_access_example() -> None:
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def _s2_reflectance_lut(no_data: int) -> np.ndarray:
+    """float32 reflectance for every uint16 value (256 KiB), NaN at no_data."""
+    import numpy as np
+
+    lut = np.arange(65_536, dtype=np.float32)
+    lut /= np.float32(10_000)
+    lut[no_data] = np.nan
+    lut.flags.writeable = False
+    return lut
+
+
 def reflectance_value_example() -> None:
     """Demonstrate how to interpret Sentinel-2 L2A reflectance values.
 
@@ -542,13 +559,12 @@ def reflectance_value_example() -> None:
     # Simulated pixel values from a Sentinel-2 chip (uint16)
     raw_values = np.array([0, 500, 1500, 3000, 8000, 10000], dtype=np.uint16)
 
-    # Mask the no-data value (0)
     no_data = SOURCE_INFO[CollectionName.SENTINEL2]['missing_value']
-    valid_mask = raw_values != no_data
 
-    # Convert to physical reflectance (0.0 to 1.0)
-    reflectance = np.full(raw_values.shape, np.nan, dtype=np.float32)
-    reflectance[valid_mask] = raw_values[valid_mask].astype(np.float32) / 10_000.0
+    # Convert to physical reflectance (0.0 to 1.0). uint16 has only 65,536
+    # possible values, so one gather from a precomputed table does the cast,
+    # the scaling and the no-data -> NaN mapping in a single pass
+    reflectance = _s2_reflectance_lut(int(no_data))[raw_values]
 
     print("Sentinel-2 reflectance conversion (uint16 -> float):")
     for raw, refl in zip(raw_values, reflectance):
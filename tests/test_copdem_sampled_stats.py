@@ -0,0 +1,64 @@
+"""The sampled chunk-first median must track the exact one for sparse cells."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+h3 = pytest.importorskip("h3")
+xr = pytest.importorskip("xarray")
+pytest.importorskip("dask")
+pytest.importorskip("rioxarray")
+
+RECIPES = Path(__file__).resolve().parents[1] / "datasets" / "recipes"
+
+
+def _load_copdem():
+    spec = importlib.util.spec_from_file_location("cop_dem", RECIPES / "cop-dem.py")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except ImportError as exc:
+        pytest.skip(f"cop-dem.py dependencies not installed: {exc}")
+    return module
+
+
+def test_sampled_median_for_cells_far_apart(monkeypatch):
+    module = _load_copdem()
+
+    # 1 arc-second grid, 0.2 degrees square, with right-skewed elevations
+    pixel = 1 / 3600
+    size = 720
+    west, north = -145.95, 60.75
+    rng = np.random.default_rng(1)
+    elevation = rng.exponential(50.0, (size, size)).astype(np.float32)
+    data = xr.DataArray(
+        elevation,
+        dims=("y", "x"),
+        coords={
+            "y": north - (np.arange(size) + 0.5) * pixel,
+            "x": west + (np.arange(size) + 0.5) * pixel,
+        },
+    ).rio.write_crs("EPSG:4326").chunk({"x": 256, "y": 256})
+
+    # Two res-9 cells in opposite corners, a tiny fraction of the raster
+    cells = [
+        h3.latlng_to_cell(north - 0.02, west + 0.02, 9),
+        h3.latlng_to_cell(north - 0.18, west + 0.18, 9),
+    ]
+    exact = module.compute_elevation_stats(data.compute(), cells, default_h3_resolution=9)
+
+    monkeypatch.setattr(module, "GLOBAL_EXTENT_MAX_PIXELS", 0)
+    monkeypatch.setattr(module, "MEDIAN_SAMPLE_SIZE", 100)
+    sampled = module.compute_elevation_stats(data, cells, default_h3_resolution=9)
+
+    np.testing.assert_allclose(
+        sampled["elevation_range"].to_numpy(), exact["elevation_range"].to_numpy()
+    )
+    # A midrange would sit near half the range, far above the median
+    np.testing.assert_allclose(
+        sampled["elevation_median"].to_numpy(),
+        exact["elevation_median"].to_numpy(),
+        rtol=0.35,
+    )
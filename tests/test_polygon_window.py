@@ -0,0 +1,56 @@
+"""Windowed per-cell masks must select exactly the pixels a full-raster mask does."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+h3 = pytest.importorskip("h3")
+rasterio = pytest.importorskip("rasterio")
+from rasterio.features import geometry_mask  # noqa: E402
+from rasterio.transform import from_origin  # noqa: E402
+
+RECIPES = Path(__file__).resolve().parents[1] / "datasets" / "recipes"
+
+
+def _load_recipe(name: str):
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), RECIPES / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except ImportError as exc:
+        pytest.skip(f"{name}.py dependencies not installed: {exc}")
+    return module
+
+
+@pytest.mark.parametrize("recipe", ["nasadem", "cop-dem"])
+@pytest.mark.parametrize("all_touched", [False, True])
+def test_polygon_window_matches_full_mask(recipe, all_touched):
+    module = _load_recipe(recipe)
+
+    # 1 arc-second grid around a ring of res-11 cells (~1 pixel across each)
+    pixel = 1 / 3600
+    transform = from_origin(-145.92, 60.67, pixel, pixel)
+    shape = (72, 72)
+    center = h3.latlng_to_cell(60.66, -145.91, 11)
+    cells = list(h3.grid_disk(center, 2))
+    polygons = module.h3_cells_to_polygons(cells)
+
+    for poly in polygons:
+        full = geometry_mask(
+            [poly], out_shape=shape, transform=transform,
+            all_touched=all_touched, invert=True,
+        )
+        window = module._polygon_window(poly, transform, shape)
+        windowed = np.zeros(shape, dtype=bool)
+        if window is not None:
+            rows, cols = window.toslices()
+            windowed[rows, cols] = geometry_mask(
+                [poly],
+                out_shape=(rows.stop - rows.start, cols.stop - cols.start),
+                transform=transform * rasterio.Affine.translation(window.col_off, window.row_off),
+                all_touched=all_touched,
+                invert=True,
+            )
+        np.testing.assert_array_equal(windowed, full)